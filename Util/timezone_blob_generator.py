@@ -6,6 +6,16 @@ This utility reads timezone mapping data from a CSV file and generates a binary
 containing packed timezone information. The blob format includes both Windows timezone
 names and IANA timezone identifiers with their corresponding DST rules and offsets.
 
+Blob format:
+    Three contiguous sections, all multi-byte values little-endian:
+    1. Header: magic "TZBLOB" + 2 NUL bytes (8 bytes), format version (u32),
+       record_count (u32). The names pool starts right after the record table.
+    2. Record table: record_count fixed-width records sorted by name, each
+       name_offset (u32, relative to the names pool), std_offset (i32),
+       dst_offset (i32), dst_rule (u32). dst_rule packs, from bit 27 down,
+       dst_start month(4)/day(5)/hour(5) and dst_end month(4)/day(5)/hour(5)
+    3. Names pool: name_length (u8) + name (UTF-8) for each record
+
 Usage:
     # Generate timezone blob with default input timezone_mappings.csv and output tzid_blob.bin
     python timezone_blob_generator.py
@@ -13,6 +23,9 @@ Usage:
     # Generate with custom input and output filenames
     python timezone_blob_generator.py -i timezones.csv -o blob.bin
     
+    # Log every added timezone pair and skipped row
+    python timezone_blob_generator.py --verbose
+    
     # Check commands
     python timezone_blob_generator.py --help
 
@@ -21,108 +34,127 @@ License: GPL v3
 Version: 1.0.0
 """
 
-import csv
+import mmap
+import multiprocessing
+import os
 import struct
 import sys
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional
+from typing import Iterator, List, Set, Tuple, Optional
 
 
 # Configuration constants
 DEFAULT_CSV_FILE = "timezone_mappings.csv"
 DEFAULT_BLOB_FILE = "tzid_blob.bin"
 
+# CSV files at least this large are parsed in a process pool
+PARALLEL_THRESHOLD_BYTES = 1 << 20
+
+# Numeric CSV columns, in the order they are packed into each record
+TIMEZONE_VALUE_COLUMNS = (
+    'standard_offset_seconds', 'dst_offset_seconds',
+    'dst_start_month', 'dst_start_day', 'dst_start_hour',
+    'dst_end_month', 'dst_end_day', 'dst_end_hour'
+)
+
 # Expected CSV headers (updated format)
-EXPECTED_HEADERS = {
-    'windows_timezone', 'iana_timezone', 'standard_offset_seconds', 
-    'dst_offset_seconds', 'dst_start_month', 'dst_start_day', 
-    'dst_start_hour', 'dst_end_month', 'dst_end_day', 'dst_end_hour'
-}
+EXPECTED_HEADERS = {'windows_timezone', 'iana_timezone', *TIMEZONE_VALUE_COLUMNS}
 
-# Binary format: name_length(1B) + name(variable) + std_offset(4B) + dst_offset(4B) + dst_fields(6B)
-TIMEZONE_STRUCT_FORMAT = "<B{}siiBBBBBB"
+# Binary format: header, then a fixed-width record table, then a names pool
+# Header: magic(8B) + format_version(4B) + record_count(4B)
+# Record: name_offset(4B) + std_offset(4B) + dst_offset(4B) + dst_rule(4B)
+BLOB_MAGIC = b"TZBLOB\0\0"
+BLOB_FORMAT_VERSION = 1
+BLOB_HEADER_STRUCT = struct.Struct("<8sII")
+TIMEZONE_RECORD_STRUCT = struct.Struct("<IiiI")
 
+# Bit layout of the packed dst_rule word (28 bits used):
+# start month(4) day(5) hour(5), end month(4) day(5) hour(5)
+DST_MONTH_BITS = 4
+DST_DAY_BITS = 5
+DST_HOUR_BITS = 5
 
-class TimezoneData:
-    """Represents timezone data with offsets and DST rules."""
-    
-    def __init__(self, std_offset: int, dst_offset: int, 
-                 dst_start_month: int, dst_start_day: int, dst_start_hour: int,
-                 dst_end_month: int, dst_end_day: int, dst_end_hour: int):
-        self.std_offset = std_offset
-        self.dst_offset = dst_offset
-        self.dst_start_month = dst_start_month
-        self.dst_start_day = dst_start_day
-        self.dst_start_hour = dst_start_hour
-        self.dst_end_month = dst_end_month
-        self.dst_end_day = dst_end_day
-        self.dst_end_hour = dst_end_hour
+
+# Timezone data as parsed from a CSV row:
+# (std_offset, dst_offset, dst_start_month, dst_start_day, dst_start_hour,
+#  dst_end_month, dst_end_day, dst_end_hour)
+TimezoneData = Tuple[int, int, int, int, int, int, int, int]
+
+# Timezone data as packed into a record: (std_offset, dst_offset, dst_rule)
+PackedTimezoneData = Tuple[int, int, int]
+
+# Parsed CSV row: (windows_timezone, iana_timezone, tz_data)
+TimezoneRow = Tuple[str, str, TimezoneData]
+
+
+def pack_dst_rule(tz_data: TimezoneData) -> int:
+    """Pack the six DST transition fields of tz_data into one 28-bit word.
     
-    def to_tuple(self) -> Tuple[int, ...]:
-        """Convert to tuple for struct packing."""
-        return (
-            self.std_offset, self.dst_offset,
-            self.dst_start_month, self.dst_start_day, self.dst_start_hour,
-            self.dst_end_month, self.dst_end_day, self.dst_end_hour
-        )
+    Raises:
+        ValueError: If a field does not fit its bit width
+    """
+    word = 0
+    for value, bits in zip(tz_data[2:], (DST_MONTH_BITS, DST_DAY_BITS, DST_HOUR_BITS) * 2):
+        if not 0 <= value < (1 << bits):
+            raise ValueError(f"DST field value {value} does not fit in {bits} bits")
+        word = (word << bits) | value
+    return word
 
 
 class TimezoneBlobGenerator:
     """Generates binary timezone mapping blobs from CSV data."""
     
-    def __init__(self, csv_file: str = DEFAULT_CSV_FILE, blob_file: str = DEFAULT_BLOB_FILE):
+    def __init__(self, csv_file: str = DEFAULT_CSV_FILE, blob_file: str = DEFAULT_BLOB_FILE,
+                 verbose: bool = False):
         self.csv_file = Path(csv_file)
         self.blob_file = Path(blob_file)
+        self.verbose = verbose
+        self.processed_rows = 0
+        self.skipped_rows = 0
         self.seen_names: Set[str] = set()
-        self.records: List[bytes] = []
+        self.records: List[Tuple[bytes, PackedTimezoneData]] = []
+        self._record_scratch = bytearray(TIMEZONE_RECORD_STRUCT.size)
     
-    def validate_csv_headers(self, reader: csv.DictReader) -> bool:
+    def validate_csv_headers(self, headers: List[str]) -> bool:
         """Validate that the CSV has expected headers."""
-        csv_headers = set(reader.fieldnames or [])
+        csv_headers = set(headers)
         if not EXPECTED_HEADERS.issubset(csv_headers):
             missing = EXPECTED_HEADERS - csv_headers
             print(f"Error: CSV missing required headers: {missing}", file=sys.stderr)
             return False
         return True
     
-    def parse_int_field(self, value: str, field_name: str, default: int = 0) -> int:
-        """Safely parse integer field from CSV with error handling."""
-        if not value or value.strip() == '':
-            return default
+    def parse_timezone_row(self, row: List[bytes], value_indices: Tuple[int, ...]) -> Optional[TimezoneData]:
+        """Parse a CSV row into a TimezoneData tuple.
         
+        Empty fields default to 0. Rows with non-integer values are skipped.
+        
+        Args:
+            row: CSV row as a list of raw byte fields
+            value_indices: Column index of each TIMEZONE_VALUE_COLUMNS entry
+        """
         try:
-            return int(value.strip())
-        except ValueError as e:
-            print(f"Warning: Invalid {field_name} value '{value}', using {default}", file=sys.stderr)
-            return default
-    
-    def parse_timezone_row(self, row: Dict[str, str]) -> Optional[TimezoneData]:
-        """Parse a CSV row into TimezoneData object."""
-        try:
-            std_offset = self.parse_int_field(row["standard_offset_seconds"], "standard_offset_seconds")
-            dst_offset = self.parse_int_field(row["dst_offset_seconds"], "dst_offset_seconds")
-            dst_start_month = self.parse_int_field(row["dst_start_month"], "dst_start_month")
-            dst_start_day = self.parse_int_field(row["dst_start_day"], "dst_start_day")
-            dst_start_hour = self.parse_int_field(row["dst_start_hour"], "dst_start_hour")
-            dst_end_month = self.parse_int_field(row["dst_end_month"], "dst_end_month")
-            dst_end_day = self.parse_int_field(row["dst_end_day"], "dst_end_day")
-            dst_end_hour = self.parse_int_field(row["dst_end_hour"], "dst_end_hour")
-            
-            return TimezoneData(
-                std_offset, dst_offset,
-                dst_start_month, dst_start_day, dst_start_hour,
-                dst_end_month, dst_end_day, dst_end_hour
-            )
-        except Exception as e:
-            print(f"Error parsing timezone row: {e}", file=sys.stderr)
+            return tuple([
+                int(value) if value and not value.isspace() else 0
+                for value in [row[index] for index in value_indices]
+            ])
+        except (ValueError, IndexError) as e:
+            self.skipped_rows += 1
+            if self.verbose:
+                print(f"Warning: Skipping invalid timezone row {row}: {e}", file=sys.stderr)
             return None
     
     def add_timezone_entry(self, name: str, tz_data: TimezoneData) -> bool:
         """Add a timezone entry to the blob if not already present."""
-        if not name or name in self.seen_names:
+        if not name:
             return False
         
-        self.seen_names.add(name)
+        # Insert and detect duplicates with a single hash operation
+        seen = self.seen_names
+        seen_count = len(seen)
+        seen.add(name)
+        if len(seen) == seen_count:
+            return False
         
         # Encode name as UTF-8
         name_bytes = name.encode("utf-8")
@@ -132,19 +164,72 @@ class TimezoneBlobGenerator:
             print(f"Warning: Timezone name too long, skipping: {name}", file=sys.stderr)
             return False
         
-        # Pack binary data
+        # Validate field ranges by packing into a reusable scratch buffer
         try:
-            packed = struct.pack(
-                TIMEZONE_STRUCT_FORMAT.format(len(name_bytes)),
-                len(name_bytes),
-                name_bytes,
-                *tz_data.to_tuple()
-            )
-            self.records.append(packed)
-            return True
-        except struct.error as e:
+            packed = (tz_data[0], tz_data[1], pack_dst_rule(tz_data))
+            TIMEZONE_RECORD_STRUCT.pack_into(self._record_scratch, 0, 0, *packed)
+        except (struct.error, ValueError) as e:
             print(f"Error packing timezone data for '{name}': {e}", file=sys.stderr)
             return False
+        
+        self.records.append((name_bytes, packed))
+        return True
+    
+    def iter_timezone_rows(self, lines: List[bytes], windows_idx: int, iana_idx: int,
+                           value_indices: Tuple[int, ...]) -> Iterator[TimezoneRow]:
+        """Yield (windows_tz, iana_tz, tz_data) for each CSV line that adds a new name.
+        
+        Names are checked against seen_names as rows are consumed, so entries
+        added by the caller between iterations are taken into account.
+        
+        Args:
+            lines: Raw CSV data lines, without the header
+            windows_idx: Column index of windows_timezone
+            iana_idx: Column index of iana_timezone
+            value_indices: Column index of each TIMEZONE_VALUE_COLUMNS entry
+        """
+        # Bind hot-loop methods once instead of per row
+        parse_row = self.parse_timezone_row
+        seen = self.seen_names
+        
+        row_count = 0
+        try:
+            for line in lines:
+                if not line:
+                    continue
+                row_count += 1
+                row = line.split(b",")
+                row_len = len(row)
+                windows_tz = row[windows_idx].strip().decode("utf-8") if windows_idx < row_len else ""
+                iana_tz = row[iana_idx].strip().decode("utf-8") if iana_idx < row_len else ""
+                
+                # Only parse the numeric fields when the row adds a new name
+                if not ((windows_tz and windows_tz not in seen) or (iana_tz and iana_tz not in seen)):
+                    continue
+                
+                tz_data = parse_row(row, value_indices)
+                if tz_data:
+                    yield windows_tz, iana_tz, tz_data
+        finally:
+            self.processed_rows += row_count
+    
+    def add_timezone_row(self, windows_tz: str, iana_tz: str, tz_data: TimezoneData) -> None:
+        """Add the Windows and IANA names of a parsed row."""
+        added_count = 0
+        
+        # Add Windows timezone name if present
+        if windows_tz:
+            if self.add_timezone_entry(windows_tz, tz_data):
+                added_count += 1
+        
+        # Add IANA timezone name if present
+        if iana_tz:
+            if self.add_timezone_entry(iana_tz, tz_data):
+                added_count += 1
+        
+        # Log when both names are added for the same timezone
+        if added_count == 2 and self.verbose:
+            print(f"Added both: '{windows_tz}' and '{iana_tz}'")
     
     def process_csv_file(self) -> bool:
         """Process the CSV file and extract timezone data."""
@@ -153,62 +238,124 @@ class TimezoneBlobGenerator:
             return False
         
         try:
-            with open(self.csv_file, newline="", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                
-                if not self.validate_csv_headers(reader):
-                    return False
-                
-                row_count = 0
-                for row in reader:
-                    row_count += 1
-                    tz_data = self.parse_timezone_row(row)
-                    if not tz_data:
-                        continue
-                    
-                    added_count = 0
-                    
-                    # Add Windows timezone name if present
-                    windows_tz = row.get("windows_timezone", "").strip()
-                    if windows_tz:
-                        if self.add_timezone_entry(windows_tz, tz_data):
-                            added_count += 1
-                    
-                    # Add IANA timezone name if present
-                    iana_tz = row.get("iana_timezone", "").strip()
-                    if iana_tz:
-                        if self.add_timezone_entry(iana_tz, tz_data):
-                            added_count += 1
-                    
-                    # Log when both names are added for the same timezone
-                    if added_count == 2:
-                        print(f"Added both: '{windows_tz}' and '{iana_tz}'")
-                
-                print(f"Processed {row_count} rows from CSV file")
-                return True
-                
+            # The mapping CSV holds only names and integers, never quoted
+            # fields, so rows are split on raw bytes without the csv module.
+            file_size = self.csv_file.stat().st_size
+            csv_lines = None
+            with open(self.csv_file, "rb") as f:
+                header_line = f.readline()
+                data_start = f.tell()
+                # Small files are ingested in one read and parsed in-process
+                if file_size < PARALLEL_THRESHOLD_BYTES:
+                    csv_lines = f.read().splitlines()
+            
+            headers = header_line.rstrip(b"\r\n").decode("utf-8").split(",") if header_line else []
+            
+            if not self.validate_csv_headers(headers):
+                return False
+            
+            # Resolve column positions once from the header row
+            windows_idx = headers.index("windows_timezone")
+            iana_idx = headers.index("iana_timezone")
+            value_indices = tuple(headers.index(column) for column in TIMEZONE_VALUE_COLUMNS)
+            
+            if csv_lines is not None:
+                add_row = self.add_timezone_row
+                for windows_tz, iana_tz, tz_data in self.iter_timezone_rows(
+                        csv_lines, windows_idx, iana_idx, value_indices):
+                    add_row(windows_tz, iana_tz, tz_data)
+            else:
+                self.process_csv_parallel(data_start, file_size, windows_idx, iana_idx, value_indices)
+            
+            print(f"Processed {self.processed_rows} rows from CSV file")
+            if self.skipped_rows:
+                print(f"Warning: Skipped {self.skipped_rows} rows with invalid timezone values",
+                      file=sys.stderr)
+            return True
+            
         except Exception as e:
             print(f"Error processing CSV file: {e}", file=sys.stderr)
             return False
     
+    def process_csv_parallel(self, data_start: int, file_size: int, windows_idx: int,
+                             iana_idx: int, value_indices: Tuple[int, ...]) -> None:
+        """Parse large CSV files in a process pool over newline-aligned byte ranges.
+        
+        Workers only parse; entries are added here in file order, so the
+        first occurrence of a name wins exactly as in the serial path.
+        """
+        worker_count = os.cpu_count() or 1
+        
+        # Split the data section on newline boundaries
+        split_points = [data_start]
+        with open(self.csv_file, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for k in range(1, worker_count):
+                target = max(data_start + (file_size - data_start) * k // worker_count, split_points[-1])
+                newline = data.find(b"\n", target)
+                if newline < 0:
+                    break
+                split_points.append(newline + 1)
+        split_points.append(file_size)
+        
+        tasks = [
+            (str(self.csv_file), start, end, windows_idx, iana_idx, value_indices, self.verbose)
+            for start, end in zip(split_points, split_points[1:]) if end > start
+        ]
+        
+        add_row = self.add_timezone_row
+        with multiprocessing.Pool(min(worker_count, len(tasks))) as pool:
+            for rows, row_count, skipped_rows in pool.imap(_parse_csv_range, tasks):
+                self.processed_rows += row_count
+                self.skipped_rows += skipped_rows
+                for windows_tz, iana_tz, tz_data in rows:
+                    add_row(windows_tz, iana_tz, tz_data)
+    
     def write_blob(self) -> bool:
-        """Write the binary blob to file."""
+        """Write the records to the blob file, sorted by name."""
         if not self.records:
             print("Warning: No timezone records to write", file=sys.stderr)
             return False
         
+        # Sorted output is deterministic regardless of CSV row order
+        self.records.sort()
+        record_count = len(self.records)
+        record_size = TIMEZONE_RECORD_STRUCT.size
+        names_offset = BLOB_HEADER_STRUCT.size + record_count * record_size
+        blob_size = names_offset + sum(1 + len(name_bytes) for name_bytes, _ in self.records)
+        
+        # Size the file up front and fill the record table and names pool
+        # in a single pass over a memory map of it. A temporary file is used
+        # so a failed write never leaves a truncated blob in place.
+        tmp_file = self.blob_file.with_name(self.blob_file.name + ".tmp")
         try:
-            blob = b"".join(self.records)
-            with open(self.blob_file, "wb") as f:
-                f.write(blob)
+            with open(tmp_file, "wb+") as f:
+                f.truncate(blob_size)
+                with mmap.mmap(f.fileno(), blob_size) as blob:
+                    BLOB_HEADER_STRUCT.pack_into(blob, 0, BLOB_MAGIC, BLOB_FORMAT_VERSION,
+                                                 record_count)
+                    pack_record_into = TIMEZONE_RECORD_STRUCT.pack_into
+                    record_offset = BLOB_HEADER_STRUCT.size
+                    name_offset = 0
+                    for name_bytes, packed in self.records:
+                        pack_record_into(blob, record_offset, name_offset, *packed)
+                        record_offset += record_size
+                        
+                        name_start = names_offset + name_offset
+                        blob[name_start] = len(name_bytes)
+                        blob[name_start + 1:name_start + 1 + len(name_bytes)] = name_bytes
+                        name_offset += 1 + len(name_bytes)
+                    blob.flush()
+            tmp_file.replace(self.blob_file)
             
             print(f"Successfully wrote {len(self.records)} timezone entries to {self.blob_file}")
-            print(f"Blob size: {len(blob)} bytes")
+            print(f"Blob size: {blob_size} bytes")
             print(f"Unique timezone names: {len(self.seen_names)}")
             
             return True
             
         except Exception as e:
+            tmp_file.unlink(missing_ok=True)
             print(f"Error writing blob file: {e}", file=sys.stderr)
             return False
     
@@ -240,43 +387,79 @@ class TimezoneBlobGenerator:
         return True
 
 
-def main():
-    """Main entry point."""
-    import argparse
-    
-    parser = argparse.ArgumentParser(
-        description="Generate binary timezone mapping blob from CSV data",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Example usage:
-  %(prog)s                                    # Use default files
-  %(prog)s -i timezones.csv -o blob.bin      # Specify custom files
-  %(prog)s --help                            # Show this help
-        """
-    )
+def _parse_csv_range(task: tuple) -> Tuple[List[TimezoneRow], int, int]:
+    """Process pool worker: parse one newline-aligned byte range of the CSV.
     
-    parser.add_argument(
-        "-i", "--input", 
-        default=DEFAULT_CSV_FILE,
-        help=f"Input CSV file (default: {DEFAULT_CSV_FILE})"
-    )
+    Returns:
+        Tuple of (rows, processed_rows, skipped_rows). Names repeated within
+        the range are dropped; duplicates across ranges are resolved by the caller.
+    """
+    csv_file, start, end, windows_idx, iana_idx, value_indices, verbose = task
+    with open(csv_file, "rb") as f:
+        f.seek(start)
+        lines = f.read(end - start).splitlines()
     
-    parser.add_argument(
-        "-o", "--output",
-        default=DEFAULT_BLOB_FILE, 
-        help=f"Output binary blob file (default: {DEFAULT_BLOB_FILE})"
-    )
-    
-    parser.add_argument(
-        "--version",
-        action="version",
-        version="%(prog)s 1.0.0"
-    )
+    generator = TimezoneBlobGenerator(csv_file, verbose=verbose)
+    seen = generator.seen_names
+    rows = []
+    for row in generator.iter_timezone_rows(lines, windows_idx, iana_idx, value_indices):
+        seen.update(row[:2])
+        rows.append(row)
+    return rows, generator.processed_rows, generator.skipped_rows
+
+
+USAGE = f"""\
+usage: timezone_blob_generator.py [-h] [-i INPUT] [-o OUTPUT] [-v] [--version]
+
+Generate binary timezone mapping blob from CSV data
+
+options:
+  -h, --help            show this help message and exit
+  -i, --input INPUT     Input CSV file (default: {DEFAULT_CSV_FILE})
+  -o, --output OUTPUT   Output binary blob file (default: {DEFAULT_BLOB_FILE})
+  -v, --verbose         Log each added timezone pair and each skipped row
+  --version             show program's version number and exit
+"""
+
+
+def parse_args(argv: List[str]) -> Tuple[str, str, bool]:
+    """Parse command line arguments without the import cost of argparse.
     
-    args = parser.parse_args()
+    Returns:
+        Tuple of (input_file, output_file, verbose)
+    """
+    input_file, output_file, verbose = DEFAULT_CSV_FILE, DEFAULT_BLOB_FILE, False
+    args = iter(argv)
+    for arg in args:
+        if arg in ("-i", "--input", "-o", "--output"):
+            value = next(args, None)
+            if value is None:
+                print(f"error: argument {arg} expects a value\n\n{USAGE}", file=sys.stderr)
+                sys.exit(2)
+            if arg in ("-i", "--input"):
+                input_file = value
+            else:
+                output_file = value
+        elif arg in ("-v", "--verbose"):
+            verbose = True
+        elif arg in ("-h", "--help"):
+            print(USAGE)
+            sys.exit(0)
+        elif arg == "--version":
+            print("timezone_blob_generator.py 1.0.0")
+            sys.exit(0)
+        else:
+            print(f"error: unrecognized argument: {arg}\n\n{USAGE}", file=sys.stderr)
+            sys.exit(2)
+    return input_file, output_file, verbose
+
+
+def main():
+    """Main entry point."""
+    input_file, output_file, verbose = parse_args(sys.argv[1:])
     
     # Create and run generator
-    generator = TimezoneBlobGenerator(args.input, args.output)
+    generator = TimezoneBlobGenerator(input_file, output_file, verbose)
     
     if generator.generate():
         print("\nBlob generation completed successfully!")
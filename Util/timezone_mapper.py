@@ -32,17 +32,22 @@ License: GPL v3
 Version: 1.0.1
 """
 
-import csv
+import contextlib
+import functools
+import hashlib
+import io
 import logging
-import platform
-import xml.etree.ElementTree as ET
+import os
+import pickle
+import sys
+import types
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
-from urllib.request import urlretrieve
-from urllib.error import URLError
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 import zoneinfo
 
+__all__ = ["TimezoneMapper", "WINDOWS_TZ_FALLBACK_MAP", "main"]
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -54,6 +59,40 @@ logger = logging.getLogger(__name__)
 CLDR_WINDOWS_ZONES_URL = (
     "https://raw.githubusercontent.com/unicode-org/cldr/main/common/supplemental/windowsZones.xml"
 )
+HTTP_USER_AGENT = "Presto-Cal-timezone-mapper/1.0.1"
+
+# Version of the cached CLDR mapping. Bump it whenever the windowsZones.xml
+# parsing changes, so mappings cached by an older parser are rebuilt.
+CLDR_CACHE_FORMAT_VERSION = 1
+
+# Response validator header -> conditional request header sent on the next fetch
+CACHE_VALIDATOR_HEADERS = {
+    "ETag": "If-None-Match",
+    "Last-Modified": "If-Modified-Since",
+}
+
+# Output CSV columns, in order
+CSV_FIELDNAMES = [
+    "windows_timezone", "iana_timezone",
+    "standard_offset_seconds", "dst_offset_seconds",
+    "dst_start_month", "dst_start_day", "dst_start_hour",
+    "dst_end_month", "dst_end_day", "dst_end_hour"
+]
+
+# Empty CSV fields for a missing DST transition, or for a row without a zone
+_NO_TRANSITION = ("", "", "")
+_NO_TRANSITION_INFO = ("", "") + _NO_TRANSITION * 2
+
+# Upper bound on threads used to analyze zones
+ANALYSIS_MAX_WORKERS = 8
+
+# Days between offset probes when scanning a year for DST transitions. A DST
+# episode shorter than this can fall between two probes and be missed.
+TRANSITION_PROBE_STEP_DAYS = 7
+
+# (std_offset, dst_offset, dst_start_month, dst_start_day, dst_start_hour,
+#  dst_end_month, dst_end_day, dst_end_hour); transition fields are "" when absent
+TransitionInfo = Tuple[Union[int, str], ...]
 
 # Hardcoded fallback mapping for Windows time zones
 # This serves as a reliable backup when CLDR data is unavailable or incomplete
@@ -218,6 +257,90 @@ WINDOWS_TZ_FALLBACK_MAP = {
     "Yukon Standard Time": "America/Whitehorse",    
 }
 
+# Freeze the fallback map against accidental mutation and precompute its keys
+WINDOWS_TZ_FALLBACK_MAP = types.MappingProxyType(WINDOWS_TZ_FALLBACK_MAP)
+_FALLBACK_KEYS = frozenset(WINDOWS_TZ_FALLBACK_MAP)
+
+
+@functools.cache
+def _all_iana_zones() -> frozenset:
+    """All IANA zones known to zoneinfo, collected on first use and then reused."""
+    return frozenset(zoneinfo.available_timezones())
+
+
+@functools.lru_cache(maxsize=1024)
+def _analyze_zone_transitions(iana_zone: str, year: int) -> TransitionInfo:
+    """Analyze a timezone's standard/DST offsets and transition dates for a year.
+    
+    Cached per (zone, year), since several Windows names share one IANA zone.
+    
+    Args:
+        iana_zone: IANA timezone identifier
+        year: Year to analyze
+        
+    Returns:
+        Flat TransitionInfo tuple in CSV column order. Offsets are in seconds,
+        transition fields are "" when the zone has no such transition
+    """
+    try:
+        tz = zoneinfo.ZoneInfo(iana_zone)
+        utcoffset = tz.utcoffset
+        
+        # Get standard and DST offsets
+        year_start = datetime(year, 1, 1)
+        start_offset = utcoffset(year_start)
+        std_offset = int(start_offset.total_seconds())
+        dst_offset = int(utcoffset(datetime(year, 7, 1)).total_seconds())
+        
+        # Probe the offset every TRANSITION_PROBE_STEP_DAYS days and at the
+        # end of the scan window. Only spans whose boundary offsets differ can
+        # hold a transition. Month boundaries are not enough: DST episodes
+        # can start and end within one month, like Cairo in September 2010
+        # or Gaza's week of DST between Ramadan and late October in 2040.
+        bound_days = list(range(0, 366, TRANSITION_PROBE_STEP_DAYS)) + [366]
+        bound_offsets = [start_offset] + [
+            utcoffset(year_start + timedelta(days=day)) for day in bound_days[1:]
+        ]
+        
+        # Zones with the same offset at every probe have no DST to find
+        if std_offset == dst_offset and bound_offsets.count(start_offset) == len(bound_offsets):
+            return (std_offset, dst_offset) + _NO_TRANSITION * 2
+        
+        # Find DST transition dates by sampling local midnight of each day
+        # within the spans that changed. Each transition is located by
+        # bisecting the span's days, keeping the offset at `lo` equal to the
+        # previous offset and the offset at `hi` different from it.
+        dst_start = dst_end = None
+        
+        for span_index in range(len(bound_days) - 1):
+            prev_offset = bound_offsets[span_index]
+            end_offset = bound_offsets[span_index + 1]
+            lo = bound_days[span_index]
+            
+            while prev_offset != end_offset:
+                hi = bound_days[span_index + 1]
+                while hi - lo > 1:
+                    mid = (lo + hi) // 2
+                    if utcoffset(year_start + timedelta(days=mid)) == prev_offset:
+                        lo = mid
+                    else:
+                        hi = mid
+                
+                dt = year_start + timedelta(days=hi)
+                offset = utcoffset(dt)
+                if offset > prev_offset:  # Spring forward
+                    dst_start = (dt.month, dt.day, dt.hour)
+                else:  # Fall back
+                    dst_end = (dt.month, dt.day, dt.hour)
+                prev_offset = offset
+                lo = hi
+        
+        return (std_offset, dst_offset, *(dst_start or _NO_TRANSITION), *(dst_end or _NO_TRANSITION))
+        
+    except Exception as e:
+        logger.warning("Failed to analyze timezone %s: %s", iana_zone, e)
+        return (0, 0) + _NO_TRANSITION * 2
+
 
 class TimezoneMapper:
     """Main class for generating timezone mappings."""
@@ -230,18 +353,49 @@ class TimezoneMapper:
         """
         self.output_file = Path(output_file)
         self.xml_file = Path("windowsZones.xml")
+        self.cldr_cache_file = Path("windowsZones.pkl")
+        # Fixed once so every zone in a run is analyzed for the same year
+        self.year = datetime.now().year
         
     def download_cldr_data(self) -> bool:
         """Download the latest CLDR windowsZones.xml file.
         
+        The ETag and Last-Modified validators of the previous download are kept
+        in a sidecar file and sent back, so an unchanged file is not re-fetched.
+        
         Returns:
-            True if download successful, False otherwise
+            True if download successful or cached copy still current, False otherwise
         """
+        from urllib.request import Request, urlopen
+        from urllib.error import HTTPError, URLError
+        
+        validators_file = self.xml_file.with_name(self.xml_file.name + ".validators")
+        headers = {"User-Agent": HTTP_USER_AGENT, "Cache-Control": "max-age=0"}
+        if self.xml_file.exists() and validators_file.exists():
+            for line in validators_file.read_text(encoding="utf-8").splitlines():
+                name, _, value = line.partition(": ")
+                if name in CACHE_VALIDATOR_HEADERS and value:
+                    headers[CACHE_VALIDATOR_HEADERS[name]] = value
+        
         try:
             logger.info("Downloading latest windowsZones.xml from CLDR...")
-            urlretrieve(CLDR_WINDOWS_ZONES_URL, self.xml_file)
+            with urlopen(Request(CLDR_WINDOWS_ZONES_URL, headers=headers)) as response:
+                data = response.read()
+                validators = [
+                    f"{name}: {response.headers[name]}"
+                    for name in CACHE_VALIDATOR_HEADERS if response.headers.get(name)
+                ]
+            
+            self.xml_file.write_bytes(data)
+            validators_file.write_text("\n".join(validators), encoding="utf-8")
             logger.info(f"Successfully downloaded to {self.xml_file}")
             return True
+        except HTTPError as e:
+            if e.code == 304:
+                logger.info(f"CLDR data not modified, using cached {self.xml_file}")
+                return True
+            logger.error(f"Failed to download CLDR data: {e}")
+            return False
         except URLError as e:
             logger.error(f"Failed to download CLDR data: {e}")
             return False
@@ -260,47 +414,55 @@ class TimezoneMapper:
         Returns:
             Dictionary mapping Windows timezone names to IANA identifiers
         """
+        import xml.etree.ElementTree as ET
+        
         try:
-            tree = ET.parse(self.xml_file)
-            root = tree.getroot()
+            # Reuse the previous parse result while the XML is unchanged
+            xml_data = self.xml_file.read_bytes()
+            xml_digest = hashlib.sha1(xml_data).hexdigest()
+            cached_mapping = self.load_cached_mapping(xml_digest)
+            if cached_mapping is not None:
+                logger.info(f"Loaded {len(cached_mapping)} timezone mappings from {self.cldr_cache_file}")
+                return cached_mapping
             
             # No namespace needed for CLDR XML
             mapping = {}
-            regional_mappings = {}
+            regional_us = {}
+            regional_any = {}
             
-            # First pass: collect all mappings
-            for map_zone in root.findall(".//mapZone"):
-                win_name = map_zone.attrib.get('other')
-                territory = map_zone.attrib.get('territory')
-                iana_zones = map_zone.attrib.get('type', '')
+            # Stream all mappings, clearing each element once handled
+            for _, map_zone in ET.iterparse(io.BytesIO(xml_data), events=("end",)):
+                if map_zone.tag != "mapZone":
+                    map_zone.clear()
+                    continue
+                
+                win_name = map_zone.get('other')
+                territory = map_zone.get('territory')
+                iana_zones = map_zone.get('type', '')
+                map_zone.clear()
                 
                 if not win_name or not iana_zones:
                     continue
                 
                 # Split multiple IANA zones and take the first (primary) one
-                primary_iana = iana_zones.split()[0] if iana_zones else ''
+                primary_iana = iana_zones.split(' ', 1)[0]
                 
                 if territory == "001":  # Global default
                     mapping[win_name] = primary_iana
-                else:  # Regional mapping
-                    if win_name not in regional_mappings:
-                        regional_mappings[win_name] = []
-                    regional_mappings[win_name].append((territory, primary_iana))
+                else:  # Regional mapping, keeping the first US and first overall
+                    if territory == "US":
+                        regional_us.setdefault(win_name, primary_iana)
+                    regional_any.setdefault(win_name, primary_iana)
             
-            # Second pass: fill gaps with regional mappings
-            # Use regional mappings for Windows zones not in global defaults
-            for win_name, regional_list in regional_mappings.items():
-                if win_name not in mapping and regional_list:
-                    # Prefer US mappings, then others
-                    us_mapping = next((iana for territory, iana in regional_list if territory == "US"), None)
-                    if us_mapping:
-                        mapping[win_name] = us_mapping
-                    else:
-                        # Use the first available regional mapping
-                        mapping[win_name] = regional_list[0][1]
+            # Fill gaps with regional mappings for Windows zones not in
+            # global defaults, preferring US mappings, then the first seen
+            for win_name, first_iana in regional_any.items():
+                mapping.setdefault(win_name, regional_us.get(win_name, first_iana))
             
             logger.info(f"Parsed {len(mapping)} timezone mappings from CLDR")
-            logger.info(f"Found {len(regional_mappings)} Windows zones with regional variants")
+            logger.info(f"Found {len(regional_any)} Windows zones with regional variants")
+            if mapping:
+                self.save_cached_mapping(xml_digest, mapping)
             return mapping
             
         except ET.ParseError as e:
@@ -310,13 +472,51 @@ class TimezoneMapper:
             logger.error(f"Unexpected error parsing CLDR mapping: {e}")
             return {}
     
+    def load_cached_mapping(self, xml_digest: str) -> Optional[Dict[str, str]]:
+        """Load the cached CLDR mapping if it was parsed from the same XML
+        by the current parser.
+        
+        Args:
+            xml_digest: SHA-1 hex digest of the current windowsZones.xml
+            
+        Returns:
+            Cached mapping, or None if missing, stale or unreadable
+        """
+        try:
+            cached = pickle.loads(self.cldr_cache_file.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable CLDR cache {self.cldr_cache_file}: {e}")
+            return None
+        # Caches written before the version field was added are 2-tuples
+        # and never match here
+        if cached[:2] != (CLDR_CACHE_FORMAT_VERSION, xml_digest):
+            logger.info(f"CLDR cache {self.cldr_cache_file} is stale, reparsing")
+            return None
+        return cached[2]
+    
+    def save_cached_mapping(self, xml_digest: str, mapping: Dict[str, str]) -> None:
+        """Cache a parsed CLDR mapping with the cache version and the digest of its XML.
+        
+        Args:
+            xml_digest: SHA-1 hex digest of the parsed windowsZones.xml
+            mapping: Parsed Windows -> IANA mapping
+        """
+        tmp_file = self.cldr_cache_file.with_name(self.cldr_cache_file.name + ".tmp")
+        try:
+            tmp_file.write_bytes(pickle.dumps((CLDR_CACHE_FORMAT_VERSION, xml_digest, mapping)))
+            tmp_file.replace(self.cldr_cache_file)
+        except OSError as e:
+            logger.warning(f"Failed to write CLDR cache {self.cldr_cache_file}: {e}")
+    
     def get_windows_timezones(self) -> List[str]:
         """Get list of Windows timezone names from registry (Windows only).
         
         Returns:
             List of Windows timezone names, empty if not on Windows
         """
-        if platform.system() != "Windows":
+        if not sys.platform.startswith("win"):
             logger.warning("Not running on Windows - skipping registry lookup")
             return []
         
@@ -340,54 +540,33 @@ class TimezoneMapper:
             logger.error(f"Failed to read Windows registry: {e}")
             return []
     
-    def analyze_timezone_transitions(self, iana_zone: str) -> Tuple[int, int, Optional[Tuple[int, int, int]], Optional[Tuple[int, int, int]]]:
+    def analyze_timezone_transitions(self, iana_zone: str) -> TransitionInfo:
         """Analyze a timezone's standard/DST offsets and transition dates.
         
         Args:
             iana_zone: IANA timezone identifier
             
         Returns:
-            Tuple of (std_offset, dst_offset, dst_start, dst_end)
-            Offsets are in seconds, transitions are (month, day, hour) tuples
+            Flat tuple of (std_offset, dst_offset, dst_start_month, dst_start_day,
+            dst_start_hour, dst_end_month, dst_end_day, dst_end_hour). Offsets
+            are in seconds, transition fields are "" when absent
         """
-        try:
-            tz = zoneinfo.ZoneInfo(iana_zone)
-            year = datetime.now().year
-            
-            # Get standard and DST offsets
-            jan1 = datetime(year, 1, 1, tzinfo=tz)
-            jul1 = datetime(year, 7, 1, tzinfo=tz)
-            std_offset = int(jan1.utcoffset().total_seconds())
-            dst_offset = int(jul1.utcoffset().total_seconds())
-            
-            # Find DST transition dates
-            dst_start = dst_end = None
-            dt = datetime(year, 1, 1)
-            prev_offset = tz.utcoffset(dt)
-            
-            for day in range(1, 367):
-                try:
-                    dt = datetime(year, 1, 1) + timedelta(days=day)
-                    offset = tz.utcoffset(dt)
-                    
-                    if offset != prev_offset:
-                        if offset > prev_offset:  # Spring forward
-                            dst_start = (dt.month, dt.day, dt.hour)
-                        else:  # Fall back
-                            dst_end = (dt.month, dt.day, dt.hour)
-                        prev_offset = offset
-                        
-                except ValueError:
-                    # Handle invalid dates (e.g., Feb 30)
-                    continue
-            
-            return std_offset, dst_offset, dst_start, dst_end
-            
-        except Exception as e:
-            logger.warning(f"Failed to analyze timezone {iana_zone}: {e}")
-            return 0, 0, None, None
+        return _analyze_zone_transitions(iana_zone, self.year)
+    
+    def prefetch_transitions(self, iana_zones: Set[str]) -> None:
+        """Analyze zones concurrently so later lookups hit the transition cache.
+        
+        Args:
+            iana_zones: IANA timezone identifiers to analyze
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        
+        worker_count = min(ANALYSIS_MAX_WORKERS, os.cpu_count() or 4)
+        with ThreadPoolExecutor(max_workers=worker_count) as pool:
+            for _ in pool.map(self.analyze_timezone_transitions, sorted(iana_zones)):
+                pass
     
-    def create_timezone_row(self, win_name: str, iana_zone: str) -> Dict[str, str]:
+    def create_timezone_row(self, win_name: str, iana_zone: str) -> Tuple:
         """Create a CSV row for a timezone mapping.
         
         Args:
@@ -395,46 +574,28 @@ class TimezoneMapper:
             iana_zone: IANA timezone identifier
             
         Returns:
-            Dictionary representing a CSV row
+            Tuple of field values in CSV_FIELDNAMES order
         """
-        if iana_zone:
-            std_offset, dst_offset, dst_start, dst_end = self.analyze_timezone_transitions(iana_zone)
-        else:
-            std_offset = dst_offset = dst_start = dst_end = None
-        
-        return {
-            "windows_timezone": win_name,
-            "iana_timezone": iana_zone or "",
-            "standard_offset_seconds": std_offset if std_offset is not None else "",
-            "dst_offset_seconds": dst_offset if dst_offset is not None else "",
-            "dst_start_month": dst_start[0] if dst_start else "",
-            "dst_start_day": dst_start[1] if dst_start else "",
-            "dst_start_hour": dst_start[2] if dst_start else "",
-            "dst_end_month": dst_end[0] if dst_end else "",
-            "dst_end_day": dst_end[1] if dst_end else "",
-            "dst_end_hour": dst_end[2] if dst_end else "",
-        }
+        if not iana_zone:
+            return (win_name, "") + _NO_TRANSITION_INFO
+        return (win_name, iana_zone) + _analyze_zone_transitions(iana_zone, self.year)
     
-    def write_csv(self, rows: List[Dict[str, str]]) -> None:
-        """Write timezone data to CSV file.
+    @contextlib.contextmanager
+    def open_csv_writer(self) -> Iterator[Any]:
+        """Open the output CSV file and yield a writer with the header written.
         
-        Args:
-            rows: List of dictionaries representing CSV rows
+        Yields:
+            csv.writer for streaming row tuples to the output file
         """
-        fieldnames = [
-            "windows_timezone", "iana_timezone", 
-            "standard_offset_seconds", "dst_offset_seconds",
-            "dst_start_month", "dst_start_day", "dst_start_hour",
-            "dst_end_month", "dst_end_day", "dst_end_hour"
-        ]
+        import csv
         
         try:
             with open(self.output_file, "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(rows)
-            
-            logger.info(f"Successfully wrote {len(rows)} entries to {self.output_file}")
+                # Never quote: the blob generator splits rows on bare commas,
+                # so a field containing a delimiter must fail here instead
+                writer = csv.writer(f, quoting=csv.QUOTE_NONE, escapechar=None)
+                writer.writerow(CSV_FIELDNAMES)
+                yield writer
             
         except Exception as e:
             logger.error(f"Failed to write CSV file: {e}")
@@ -457,21 +618,19 @@ class TimezoneMapper:
         
         # Merge CLDR mappings with fallback mappings
         # CLDR takes precedence over fallback when available
-        combined_map = WINDOWS_TZ_FALLBACK_MAP.copy()
+        combined_map = {**WINDOWS_TZ_FALLBACK_MAP, **cldr_map}
         if cldr_map:
-            # Update fallback with CLDR data
-            combined_map.update(cldr_map)
             cldr_count = len(cldr_map)
             fallback_count = len(WINDOWS_TZ_FALLBACK_MAP)
-            overlap_count = len(set(cldr_map.keys()) & set(WINDOWS_TZ_FALLBACK_MAP.keys()))
-            new_from_cldr = len(set(cldr_map.keys()) - set(WINDOWS_TZ_FALLBACK_MAP.keys()))
+            overlap_count = len(_FALLBACK_KEYS.intersection(cldr_map))
+            new_from_cldr = len(cldr_map.keys() - _FALLBACK_KEYS)
             
             logger.info(f"Merged mappings: {len(combined_map)} total ({cldr_count} from CLDR, "
                        f"{fallback_count} fallback, {overlap_count} overlapping, {new_from_cldr} new from CLDR)")
             
             if new_from_cldr > 0:
                 logger.info("CLDR provided additional mappings not in fallback - consider updating fallback map")
-                new_mappings = {k: v for k, v in cldr_map.items() if k not in WINDOWS_TZ_FALLBACK_MAP}
+                new_mappings = {k: v for k, v in cldr_map.items() if k not in _FALLBACK_KEYS}
                 logger.info(f"New mappings from CLDR: {list(new_mappings.keys())[:10]}{'...' if len(new_mappings) > 10 else ''}")
         else:
             logger.info(f"Using fallback mappings only: {len(combined_map)} total")
@@ -484,49 +643,57 @@ class TimezoneMapper:
             logger.info("Using all known Windows timezone mappings")
             windows_timezones = list(combined_map.keys())
         
-        rows = []
-        mapped_iana_zones: Set[str] = set()
+        # Analyze every zone up front on a thread pool; rows below are then
+        # built in order from the cached results
+        self.prefetch_transitions(
+            {combined_map[win_name] for win_name in windows_timezones if combined_map.get(win_name)}
+            | _all_iana_zones()
+        )
         
-        # Process Windows timezone mappings
-        logger.info("Processing Windows timezone mappings...")
+        mapped_iana_zones: Set[str] = set()
         unmapped_windows_zones = []
-        for win_name in sorted(windows_timezones):
-            iana_zone = combined_map.get(win_name)
-            if iana_zone:
-                mapped_iana_zones.add(iana_zone)
-            else:
-                logger.warning(f"No mapping found for Windows timezone: {win_name}")
-                unmapped_windows_zones.append(win_name)
-            
-            row = self.create_timezone_row(win_name, iana_zone)
-            rows.append(row)
-        
-        # Report unmapped zones for future fallback updates
-        if unmapped_windows_zones:
-            logger.warning(f"Found {len(unmapped_windows_zones)} unmapped Windows timezones:")
-            for zone in unmapped_windows_zones[:20]:  # Show first 20
-                logger.warning(f"  - {zone}")
-            if len(unmapped_windows_zones) > 20:
-                logger.warning(f"  ... and {len(unmapped_windows_zones) - 20} more")
-            
-            logger.info("To update the fallback map, consider researching these mappings and adding them to WINDOWS_TZ_FALLBACK_MAP")
-        
-        # Process remaining IANA-only timezones
-        logger.info("Processing IANA-only timezones...")
-        all_iana_zones = sorted(zoneinfo.available_timezones())
         iana_only_count = 0
+        total_entries = 0
         
-        for iana_zone in all_iana_zones:
-            if iana_zone not in mapped_iana_zones:
-                row = self.create_timezone_row("", iana_zone)
-                rows.append(row)
+        # Stream each row to the output file as soon as it is built
+        with self.open_csv_writer() as writer:
+            # Bind per-row calls once instead of per row
+            create_row = self.create_timezone_row
+            write_row = writer.writerow
+            
+            # Process Windows timezone mappings
+            logger.info("Processing Windows timezone mappings...")
+            for win_name in sorted(windows_timezones):
+                iana_zone = combined_map.get(win_name)
+                if iana_zone:
+                    mapped_iana_zones.add(iana_zone)
+                else:
+                    logger.warning("No mapping found for Windows timezone: %s", win_name)
+                    unmapped_windows_zones.append(win_name)
+                
+                write_row(create_row(win_name, iana_zone))
+                total_entries += 1
+            
+            # Report unmapped zones for future fallback updates
+            if unmapped_windows_zones:
+                logger.warning(f"Found {len(unmapped_windows_zones)} unmapped Windows timezones:")
+                for zone in unmapped_windows_zones[:20]:  # Show first 20
+                    logger.warning("  - %s", zone)
+                if len(unmapped_windows_zones) > 20:
+                    logger.warning(f"  ... and {len(unmapped_windows_zones) - 20} more")
+                
+                logger.info("To update the fallback map, consider researching these mappings and adding them to WINDOWS_TZ_FALLBACK_MAP")
+            
+            # Process remaining IANA-only timezones
+            logger.info("Processing IANA-only timezones...")
+            for iana_zone in sorted(_all_iana_zones() - mapped_iana_zones):
+                write_row(create_row("", iana_zone))
                 iana_only_count += 1
+                total_entries += 1
         
-        # Write results
-        self.write_csv(rows)
-        
+        logger.info(f"Successfully wrote {total_entries} entries to {self.output_file}")
         logger.info(f"Generation complete!")
-        logger.info(f"Total entries: {len(rows)}")
+        logger.info(f"Total entries: {total_entries}")
         logger.info(f"Windows mappings: {len(windows_timezones)}")
         logger.info(f"IANA-only zones: {iana_only_count}")
         if unmapped_windows_zones:
@@ -554,12 +721,11 @@ class TimezoneMapper:
             
         # Find mappings in CLDR that aren't in our fallback
         missing_from_fallback = {k: v for k, v in cldr_map.items() 
-                               if k not in WINDOWS_TZ_FALLBACK_MAP}
+                               if k not in _FALLBACK_KEYS}
         
         # Also check for unmapped Windows registry zones
         windows_timezones = self.get_windows_timezones()
-        combined_map = WINDOWS_TZ_FALLBACK_MAP.copy()
-        combined_map.update(cldr_map)
+        combined_map = {**WINDOWS_TZ_FALLBACK_MAP, **cldr_map}
         
         unmapped_registry_zones = [tz for tz in windows_timezones if tz not in combined_map]
         
@@ -573,7 +739,7 @@ class TimezoneMapper:
         if unmapped_registry_zones:
             logger.warning(f"Found {len(unmapped_registry_zones)} Windows registry zones not in CLDR or fallback:")
             for zone in unmapped_registry_zones:
-                logger.warning(f"  - {zone}")
+                logger.warning("  - %s", zone)
             logger.info("These may be deprecated/obsolete timezones that need manual research")
             logger.info("Check Microsoft documentation or historical timezone data for mappings")
         
@@ -1,6 +1,6 @@
 CONFIG = {
     # Core functionality
-    "ical_url": "https://www.kayaposoft.com/enrico/ics/v2.0?country=can&fromDate=01-01-2025&toDate=31-12-2025&region=ab&holidayType=all&lang=en,
+    "ical_url": "https://www.kayaposoft.com/enrico/ics/v2.0?country=can&fromDate=01-01-2025&toDate=31-12-2025&region=ab&holidayType=all&lang=en",
     "default_tz": "America/Los_Angeles",
     "display_tz": "America/Los_Angeles",
     "theme": "dark",
@@ -26,6 +26,7 @@ CONFIG = {
     "SLEEP_START_HOUR": 23,
     "SLEEP_END_HOUR": 6,
     "SLEEP_INACTIVITY_MINUTES": 60,
+    "DEBUG": False,  # Print routine refresh and network diagnostics
     
     # Hardware
     "BUZZ_PATTERN": [200, 100, 200],
@@ -8,7 +8,7 @@ from machine import RTC
 sys.path.append('./lib')
 
 from presto import Buzzer, Presto
-from picovector import PicoVector, ANTIALIAS_BEST, Polygon, Transform
+from picovector import PicoVector, ANTIALIAS_BEST, Transform
 import ical_parser
 import config_data
 
@@ -25,30 +25,80 @@ THEMES = None
 THEME = None
 _sleep_text_pen = None
 
+# Card pens as (border, text, description), built by init_themes()
+_CARD_CANCELED, _CARD_ONGOING, _CARD_ALLDAY, _CARD_FUTURE, _CARD_PAST = range(5)
+_card_pens = ()
+_row_bg_pens = ()
+
+# Layout constants, cached from CONFIG by init_layout()
+_line_spacing = 4
+_card_padding = 8
+_event_spacing = 2
+_line_height = 0
+_display_tz = "America/Los_Angeles"
+
 # Application state
 _current_page = 0
 _events = []
+_events_rev = 0
 _last_refresh = 0
 _last_activity = 0
 _last_touch = None
 _initial_touch_x = None
 _initial_touch_y = None
+_events_per_page_cache = {"events_id": None, "value": None, "pages": 1}
+_layout_cache = {"key": None, "value": None}
+_sleep_metrics_cache = {"font_size": None, "value": None}
+_alert_queue_cache = {"events": None, "queue": None, "next": 0}
+_hour_cache = {"bucket": None, "hour": 0}
+_STATE_CACHE_SECONDS = 30
+_next_start_cache = {"rev": None, "ts": None}
+_text_metrics_cache = {}
+_TEXT_METRICS_CACHE_SIZE = 128
+
+# Garbage collection throttling
+_last_gc_ts = 0
+_GC_INTERVAL = 60
+_GC_FREE_THRESHOLD = 64 * 1024
+
+# Deferred redraw state
+_redraw_pending = False
+_last_frame_ms = 0
+MIN_REDRAW_INTERVAL_MS = 33
 
 # Hardware state
+_last_led = [None, None]
+_last_backlight = None
+_blink_phase = 0
+_blink_next_ms = 0
 _backlight_dimmed = False
-_backlight_check_interval = 0
+_backlight_next_check_ms = 0
+
+# Behaviour settings read from CONFIG by init_settings()
+_refresh_interval = 900
+_show_memory = False
+_debug = False
+_quiet_start_hour = 22
+_quiet_end_hour = 7
+_sleep_start_hour = 23
+_sleep_end_hour = 6
+_sleep_inactivity_s = 3600
+_buzz_pattern = [200, 100, 200]
 
 # Network status tracking
 _network_status = {"connected": True, "last_error": 0, "error_count": 0, "last_success": 0}
 
 # Screen sleep state
-_screen_sleep_state = {"active": False, "sleep_start_time": 0}
+_screen_sleep_state = {"active": False, "sleep_start_time": 0, "text_bbox": None, "next_update_ms": 0,
+                       "inverted_shift": None}
 
 # === HARDWARE INITIALIZATION ===
 buzzer = Buzzer(CONFIG.get("buzzer_pin", 43))
 presto = Presto(ambient_light=False, full_res=True)
 display = presto.display
 touch = presto.touch
+# The FT6236 driver keeps the last polled press state; older firmware may not
+_TOUCH_HAS_STATE = hasattr(touch, "state")
 WIDTH, HEIGHT = display.get_bounds()
 vector = PicoVector(display)
 vector.set_antialiasing(ANTIALIAS_BEST)
@@ -58,7 +108,7 @@ transform = Transform()
 
 # === SCREEN REGION MANAGEMENT ===
 class ScreenRegion:
-    def __init__(self, x, y, width, height, name):
+    def __init__(self, x, y, width, height, name, min_interval=0):
         self.x = x
         self.y = y
         self.width = width
@@ -66,6 +116,8 @@ class ScreenRegion:
         self.name = name
         self.last_content = None
         self.dirty = True
+        self.min_interval = min_interval
+        self.last_update_ts = 0
         
     def mark_dirty(self):
         self.dirty = True
@@ -76,6 +128,9 @@ class ScreenRegion:
     def clear_dirty(self):
         self.dirty = False
         
+    def is_rate_limited(self, now):
+        return now - self.last_update_ts < self.min_interval
+        
     def set_content_hash(self, content_hash):
         if self.last_content != content_hash:
             self.last_content = content_hash
@@ -83,62 +138,64 @@ class ScreenRegion:
             return True
         return False
 
+def compute_header_layout(width, title_font_size, padding_top, padding_bottom):
+    """Compute header row height and (x, width) of each header region in one pass."""
+    # Calculate header row height based on title font
+    set_font_size(title_font_size)
+    _, _, _, title_height = vector.measure_text("Calendar Mg")
+    set_font_size(CONFIG.get("FONT_HEIGHT", 8))  # Reset to normal font
+    header_row_height = padding_top + title_height + padding_bottom
+    
+    # Widths: pagination left, title, refresh, memory, status, pagination right
+    widths = [50, 190, 130, 60, 60, 50]
+    
+    # Adjust widths to fit screen if needed
+    total_width = sum(widths)
+    if total_width > width:
+        scale_factor = width / total_width
+        widths = [int(w * scale_factor) for w in widths]
+    
+    columns = []
+    current_x = 0
+    for w in widths:
+        columns.append((current_x, w))
+        current_x += w
+    
+    return header_row_height, columns
+
 def init_regions():
     """Initialize screen regions - 6 horizontal regions in top row, events below."""
     global REGIONS
     
-    # Calculate header row height based on title font
     title_font_size = CONFIG.get("TITLE_FONT_HEIGHT", 32)
-    vector.set_font_size(title_font_size)
-    _, _, _, title_height = vector.measure_text("Calendar Mg")
-    vector.set_font_size(CONFIG.get("FONT_HEIGHT", 8))  # Reset to normal font
-    
-    # Header row height with padding
     padding_top = CONFIG.get("TITLE_PADDING_TOP", 20)
     padding_bottom = CONFIG.get("TITLE_PADDING_BOTTOM", 15)
-    header_row_height = padding_top + title_height + padding_bottom
-    
-    # Define widths for each region in the top row
-    pagination_left_width = 50
-    title_width = 190
-    refresh_width = 130
-    memory_width = 60
-    status_width = 60
-    pagination_right_width = 50
-    
-    # Calculate starting positions
-    x_positions = []
-    current_x = 0
-    widths = [pagination_left_width, title_width, refresh_width, memory_width, status_width, pagination_right_width]
     
-    for width in widths:
-        x_positions.append(current_x)
-        current_x += width
+    # Layout only depends on screen width and title settings
+    layout_key = (WIDTH, title_font_size, padding_top, padding_bottom)
+    if _layout_cache["key"] != layout_key:
+        _layout_cache["value"] = compute_header_layout(*layout_key)
+        _layout_cache["key"] = layout_key
+    header_row_height, columns = _layout_cache["value"]
     
-    # Adjust widths to fit screen if needed
-    total_width = sum(widths)
-    if total_width > WIDTH:
-        scale_factor = WIDTH / total_width
-        widths = [int(w * scale_factor) for w in widths]
-        # Recalculate positions
-        x_positions = []
-        current_x = 0
-        for width in widths:
-            x_positions.append(current_x)
-            current_x += width
+    (pl_x, pl_w), (hd_x, hd_w), (rf_x, rf_w), (mm_x, mm_w), (st_x, st_w), (pr_x, pr_w) = columns
     
     REGIONS = {
-        "pagination_left": ScreenRegion(x_positions[0], 0, widths[0], header_row_height, "pagination_left"),
-        "header": ScreenRegion(x_positions[1], 0, widths[1], header_row_height, "header"),
-        "refresh": ScreenRegion(x_positions[2], 0, widths[2], header_row_height, "refresh"),
-        "memory": ScreenRegion(x_positions[3], 0, widths[3], header_row_height, "memory"),
-        "status": ScreenRegion(x_positions[4], 0, widths[4], header_row_height, "status"),
-        "pagination_right": ScreenRegion(x_positions[5], 0, widths[5], header_row_height, "pagination_right"),
+        "pagination_left": ScreenRegion(pl_x, 0, pl_w, header_row_height, "pagination_left"),
+        "header": ScreenRegion(hd_x, 0, hd_w, header_row_height, "header"),
+        "refresh": ScreenRegion(rf_x, 0, rf_w, header_row_height, "refresh", min_interval=30),
+        "memory": ScreenRegion(mm_x, 0, mm_w, header_row_height, "memory", min_interval=10),
+        "status": ScreenRegion(st_x, 0, st_w, header_row_height, "status", min_interval=5),
+        "pagination_right": ScreenRegion(pr_x, 0, pr_w, header_row_height, "pagination_right"),
         "events": ScreenRegion(0, header_row_height + 5, WIDTH, HEIGHT - header_row_height - 5, "events"),
     }
 
-def update_region(region_name, update_func, force=False):
-    """Update a specific screen region only if dirty or forced."""
+def update_region(region_name, update_func, force=False, clear=True, now=None):
+    """Update a specific screen region only if dirty and not rate-limited, or forced.
+    
+    Pass clear=False when the whole screen was just cleared to the background,
+    and now when the caller already has the current time.
+    """
     if region_name not in REGIONS:
         return False
         
@@ -146,16 +203,21 @@ def update_region(region_name, update_func, force=False):
     if not force and not region.is_dirty():
         return False
     
+    if now is None:
+        now = utime.time()
+    if not force and region.is_rate_limited(now):
+        return False
+    
     # Clear the region background first
-    display.set_pen(THEME["BG_COLOR"])
-    clear_rect = Polygon()
-    clear_rect.rectangle(int(region.x), int(region.y), int(region.width), int(region.height))
-    vector.draw(clear_rect)
+    if clear:
+        display.set_pen(THEME["BG_COLOR"])
+        display.rectangle(int(region.x), int(region.y), int(region.width), int(region.height))
     
     # Call the update function
     try:
         result = update_func(region)
         region.clear_dirty()
+        region.last_update_ts = now
         return True
     except Exception as e:
         print(f"Region update failed for {region_name}: {e}")
@@ -171,6 +233,17 @@ def mark_all_regions_dirty():
     for region in REGIONS.values():
         region.mark_dirty()
 
+def request_redraw(*region_names):
+    """Mark regions dirty and let the main loop redraw them on its next frame."""
+    global _redraw_pending
+    for region_name in region_names:
+        mark_region_dirty(region_name)
+    _redraw_pending = True
+
+def redraw_due():
+    """Check whether a deferred redraw is pending and the frame interval has passed."""
+    return _redraw_pending and utime.ticks_diff(utime.ticks_ms(), _last_frame_ms) >= MIN_REDRAW_INTERVAL_MS
+
 # === THEME MANAGEMENT ===
 def create_theme_pens():
     """Create pen objects for all theme colors."""
@@ -233,22 +306,81 @@ def create_theme_pens():
 
 def init_themes():
     """Initialize theme pen objects."""
-    global THEMES, THEME, _sleep_text_pen
+    global THEMES, THEME, _sleep_text_pen, _card_pens, _row_bg_pens
     THEMES = create_theme_pens()
     THEME = THEMES[CONFIG.get("theme", "dark")]
     _sleep_text_pen = display.create_pen(102, 102, 102)
-    
+    _sleep_metrics_cache["font_size"] = None
+    
+    # Indexed by the _CARD_* state constants
+    _card_pens = (
+        (THEME["PAST_ACCENT"], THEME["EVENT_TEXT_CANCELED"], THEME["EVENT_DESC_CANCELED"]),
+        (THEME["ONGOING_ACCENT"], THEME["EVENT_TEXT_ONGOING"], THEME["EVENT_DESC_ONGOING"]),
+        (THEME["ALLDAY_ACCENT"], THEME["EVENT_TEXT_ALLDAY"], THEME["EVENT_DESC_ALLDAY"]),
+        (THEME["FUTURE_ACCENT"], THEME["EVENT_TEXT_FUTURE"], THEME["EVENT_DESC_FUTURE"]),
+        (THEME["PAST_ACCENT"], THEME["EVENT_TEXT_PAST"], THEME["EVENT_DESC_PAST"]),
+    )
+    _row_bg_pens = (THEME["ROW_BG_COLOR_ODD"], THEME["ROW_BG_COLOR_EVEN"])
+    
+# === SETTINGS ===
+def init_settings():
+    """Cache the CONFIG values read by the main loop tasks; call again after writing CONFIG."""
+    global _refresh_interval, _show_memory, _debug
+    global _quiet_start_hour, _quiet_end_hour, _sleep_start_hour, _sleep_end_hour
+    global _sleep_inactivity_s, _buzz_pattern
+    _refresh_interval = CONFIG.get("REFRESH_INTERVAL", 900)
+    _show_memory = CONFIG.get("SHOW_MEMORY", False)
+    _debug = CONFIG.get("DEBUG", False)
+    _quiet_start_hour = CONFIG.get("QUIET_START_HOUR", 22)
+    _quiet_end_hour = CONFIG.get("QUIET_END_HOUR", 7)
+    _sleep_start_hour = CONFIG.get("SLEEP_START_HOUR", 23)
+    _sleep_end_hour = CONFIG.get("SLEEP_END_HOUR", 6)
+    _sleep_inactivity_s = CONFIG.get("SLEEP_INACTIVITY_MINUTES", 60) * 60
+    _buzz_pattern = CONFIG.get("BUZZ_PATTERN", [200, 100, 200])
+
+# === LAYOUT ===
+def init_layout():
+    """Cache layout settings used by the per-card drawing code."""
+    global _line_spacing, _card_padding, _event_spacing, _line_height, _display_tz
+    _line_spacing = int(CONFIG.get("LINE_SPACING", 4))
+    _card_padding = int(CONFIG.get("CARD_PADDING", 8))
+    _event_spacing = int(CONFIG.get("EVENT_SPACING", 2))
+    _display_tz = CONFIG.get("display_tz", CONFIG.get("default_tz", "America/Los_Angeles"))
+    
+    # Body text height at the normal font size, including descenders
+    set_font_size(CONFIG.get("FONT_HEIGHT", 8))
+    _, _line_height = get_text_metrics("Mg")
+
 # === UTILITY FUNCTIONS ===
+def _dbg(*args):
+    """Print diagnostics only when CONFIG["DEBUG"] is set."""
+    if _debug:
+        print(*args)
+
 def get_max_events():
     """Get maximum events from config with fallback."""
     return CONFIG.get("MAX_EVENTS", 40)
 
+def set_font_size(size):
+    """Set the vector font size, tracking it for the text metrics cache."""
+    global font_size
+    font_size = size
+    vector.set_font_size(size)
+
 def get_text_metrics(text="M"):
-    """Get text dimensions."""
+    """Get text dimensions, cached per font size."""
     if not text:
         return 0, 0
+    key = (font_size, text)
+    metrics = _text_metrics_cache.get(key)
+    if metrics:
+        return metrics
+    if len(_text_metrics_cache) >= _TEXT_METRICS_CACHE_SIZE:
+        _text_metrics_cache.clear()
     _, _, w, h = vector.measure_text(text)
-    return int(w), int(h)
+    metrics = (int(w), int(h))
+    _text_metrics_cache[key] = metrics
+    return metrics
 
 def truncate_text_to_width(text, max_width):
     """Truncate text to fit within specified pixel width."""
@@ -260,7 +392,26 @@ def truncate_text_to_width(text, max_width):
     if full_w <= max_width:
         return text
     
-    # Binary search for optimal length
+    # Estimate the cut from a wide glyph, then step towards the boundary
+    char_w, _ = get_text_metrics("M")
+    if char_w > 0:
+        text_len = len(text)
+        cut = min(text_len - 1, max(0, int(max_width / char_w) - 1))
+        fits = get_text_metrics(text[:cut] + "…")[0] <= max_width
+        step = 1 if fits else -1
+        
+        for _ in range(3):
+            next_cut = cut + step
+            if next_cut >= text_len:
+                return text[:cut] + "…"
+            if next_cut < 0:
+                return "…"
+            next_fits = get_text_metrics(text[:next_cut] + "…")[0] <= max_width
+            if next_fits != fits:
+                return text[:cut] + "…" if fits else text[:next_cut] + "…"
+            cut = next_cut
+    
+    # Fall back to binary search when the estimate is far off
     left, right = 0, len(text)
     best_text = ""
     
@@ -291,6 +442,12 @@ def get_memory_stats():
 
 def format_time_tuple(t, fmt="%m/%d %H:%M"):
     """Simple strftime replacement."""
+    # Fast paths for the formats used by the display
+    if fmt == "%m/%d %H:%M":
+        return f"{t[1]:02d}/{t[2]:02d} {t[3]:02d}:{t[4]:02d}"
+    if fmt == "%m/%d":
+        return f"{t[1]:02d}/{t[2]:02d}"
+    
     y, mo, d, hh, mm, ss = t[0:6]
     return (fmt
         .replace("%Y", str(y))
@@ -301,11 +458,31 @@ def format_time_tuple(t, fmt="%m/%d %H:%M"):
         .replace("%S", f"{ss:02d}")
     )
 
+def collect_garbage_if_needed():
+    """Run gc.collect() only when memory is low or a collection is overdue."""
+    global _last_gc_ts
+    now = utime.time()
+    try:
+        low_memory = gc.mem_free() < _GC_FREE_THRESHOLD
+    except AttributeError:
+        low_memory = False
+    if low_memory or now - _last_gc_ts > _GC_INTERVAL:
+        gc.collect()
+        _last_gc_ts = now
+
+def get_local_hour(ts):
+    """Return utime.localtime(ts)[3], reusing the result within the same hour."""
+    bucket = ts // 3600
+    if _hour_cache["bucket"] != bucket:
+        _hour_cache["bucket"] = bucket
+        _hour_cache["hour"] = utime.localtime(ts)[3]
+    return _hour_cache["hour"]
+
 def in_quiet_hours(ts):
     """Check if in quiet hours."""
-    h = utime.localtime(ts)[3]
-    start = CONFIG.get("QUIET_START_HOUR", 22)
-    end = CONFIG.get("QUIET_END_HOUR", 7)
+    h = get_local_hour(ts)
+    start = _quiet_start_hour
+    end = _quiet_end_hour
     if start < end:
         return start <= h < end
     else:
@@ -341,35 +518,82 @@ def sort_events_by_priority(events):
 
     return sorted(events, key=sort_key)
 
-def get_event_type_and_state(event, now_ts):
-    """Determine event type and state."""
-    display_tz = CONFIG.get("display_tz", CONFIG.get("default_tz", "America/Los_Angeles"))
-    
+def is_canceled_summary(summary):
+    """Check for a "canceled:" prefix, avoiding a lowercase copy for common spellings."""
+    if not summary or len(summary) < 9:
+        return False
+    prefix = summary[:9]
+    return (prefix == "Canceled:" or prefix == "canceled:" or prefix == "CANCELED:"
+            or prefix.lower() == "canceled:")
+
+def build_event_meta(event, display_tz):
+    """Precompute the time-independent display fields for an event."""
     duration = event.dtend - event.dtstart
-    start_ts = event.dtstart
-    start_local = ical_parser.convert_to_local(start_ts, display_tz)
+    start_local = ical_parser.convert_to_local(event.dtstart, display_tz)
     end_local = ical_parser.convert_to_local(event.dtend, display_tz)
     
     # Event type
     multi_day = start_local[:3] != end_local[:3]
     all_day = not multi_day and duration >= 86400
-    is_timed = not (multi_day or all_day)
     
-    # Event state
-    now_display_tz = ical_parser.convert_to_local(now_ts, display_tz)
-    now_display_ts = utime.mktime(now_display_tz[:6] + (0, 0, 0))
     start_display_ts = utime.mktime(start_local[:6] + (0, 0, 0))
+    start_day_ts = utime.mktime(start_local[:3] + (0,0,0,0,0))
+    end_day_ts = utime.mktime(end_local[:3] + (0,0,0,0,0))
+    
+    is_canceled = is_canceled_summary(event.summary)
+    
+    # Format time string
+    if multi_day:
+        time_str = format_time_tuple(start_local,'%m/%d') + "-" + format_time_tuple(end_local,'%m/%d') + " Multi-Day"
+    elif all_day:
+        time_str = format_time_tuple(start_local, '%m/%d') + " All-Day"
+    else:
+        duration_minutes = duration // 60
+        time_str = format_time_tuple(start_local, '%m/%d %H:%M') + f" {duration_minutes}min"
+    
+    # Title is drawn at x=8, so leave the same margin on the right
+    title = truncate_text_to_width(str(event.summary if event.summary is not None else 'Untitled'), WIDTH - 16)
+    
+    return (start_local, end_local, duration, multi_day, all_day, is_canceled,
+            start_display_ts, start_day_ts, end_day_ts, time_str, title)
+
+def get_event_meta(event):
+    """Return the precomputed display fields, building them if missing."""
+    meta = getattr(event, "meta", None)
+    if meta is None:
+        display_tz = CONFIG.get("display_tz", CONFIG.get("default_tz", "America/Los_Angeles"))
+        meta = build_event_meta(event, display_tz)
+        event.meta = meta
+    return meta
+
+def is_event_canceled(event):
+    """Return the cached cancellation flag for an event."""
+    return get_event_meta(event)[5]
+
+def get_display_now_ts(now_ts):
+    """Convert a UTC timestamp to a naive timestamp in the display timezone."""
+    now_display_tz = ical_parser.convert_to_local(now_ts, _display_tz)
+    return utime.mktime(now_display_tz[:6] + (0, 0, 0))
+
+def get_event_type_and_state(event, now_ts, now_display_ts=None):
+    """Determine event type and state, reusing the result within a short time bucket."""
+    bucket = now_ts // _STATE_CACHE_SECONDS
+    if getattr(event, "state_cache_bucket", None) == bucket:
+        return event.state_cache
+    
+    (start_local, end_local, duration, multi_day, all_day, is_canceled,
+     _, event_start_day_ts, event_end_day_ts, _, _) = get_event_meta(event)
+    is_timed = not (multi_day or all_day)
     
+    # Event state is the only time-dependent part
     if multi_day or all_day:
-        event_start_day_ts = utime.mktime(start_local[:3] + (0,0,0,0,0))
-        event_end_day_ts = utime.mktime(end_local[:3] + (0,0,0,0,0))
+        if now_display_ts is None:
+            now_display_ts = get_display_now_ts(now_ts)
         ongoing = (now_display_ts >= event_start_day_ts and now_display_ts <= event_end_day_ts)
     else:
-        ongoing = (start_ts <= now_ts <= event.dtend)
-
-    is_canceled = event.summary.lower().startswith("canceled:")
+        ongoing = (event.dtstart <= now_ts <= event.dtend)
     
-    return {
+    event_info = {
         'multi_day': multi_day,
         'all_day': all_day,
         'is_timed': is_timed,
@@ -381,9 +605,15 @@ def get_event_type_and_state(event, now_ts):
         'summary': event.summary,
         'description': event.description
     }
+    event.state_cache_bucket = bucket
+    event.state_cache = event_info
+    return event_info
 
 def load_events():
     """Load and process events."""
+    global _events_rev
+    _events_rev += 1
+    
     now = utime.time()
     display_tz = CONFIG.get("display_tz", CONFIG.get("default_tz", "America/Los_Angeles"))
     local_now = ical_parser.convert_to_local(now, display_tz)
@@ -398,6 +628,11 @@ def load_events():
         events = ical_parser.get_events(ICS_URL, get_max_events(), filter_time, days_to_parse)
         if events:
             sorted_events = sort_events_by_priority(events)
+            # Events served from the parser cache keep their precomputed fields
+            for e in sorted_events:
+                if getattr(e, "meta", None) is None:
+                    e.meta = build_event_meta(e, display_tz)
+                e.state_cache_bucket = None
             gc.collect()
             return sorted_events
         else:
@@ -408,26 +643,36 @@ def load_events():
         return []
     
 # === DISPLAY CALCULATIONS ===
+def card_geometry(event):
+    """Return (card_height, has_desc_line) for an event card."""
+    desc = event.description
+    has_desc_line = bool(desc) and len(desc) < 50
+    total_lines = 3 if has_desc_line else 2  # Time and title lines always present
+    card_height = _card_padding * 2 + total_lines * _line_height + (total_lines - 1) * _line_spacing
+    return card_height, has_desc_line
+
 def calculate_event_card_height(event):
-    """Calculate event card height using accurate text measurement."""
-    title = str(event.summary if event.summary is not None else 'Untitled')
-    desc = event.description if event.description is not None else ''
-    
-    _, line_height = get_text_metrics("Mg")
-    line_spacing = CONFIG.get("LINE_SPACING", 4)
-    padding = CONFIG.get("CARD_PADDING", 8)
-    
-    total_lines = 2  # Time and title lines always present
-    
-    if desc and len(desc) < 50:
-        total_lines += 1
-    
-    card_height = padding + (total_lines * line_height) + ((total_lines - 1) * line_spacing) + padding
-    
-    return card_height
+    """Calculate event card height from the precomputed line metrics."""
+    return card_geometry(event)[0]
 
 def get_events_per_page():
-    """Calculate optimal events per page."""
+    """Calculate optimal events per page, reusing the result for the same event list."""
+    if _events_per_page_cache["events_id"] == id(_events):
+        return _events_per_page_cache["value"]
+
+    per_page = _calculate_events_per_page()
+    _events_per_page_cache["events_id"] = id(_events)
+    _events_per_page_cache["value"] = per_page
+    _events_per_page_cache["pages"] = (len(_events) + per_page - 1) // per_page
+    return per_page
+
+def get_page_count():
+    """Number of pages for the current event list, cached alongside events per page."""
+    get_events_per_page()
+    return _events_per_page_cache["pages"]
+
+def _calculate_events_per_page():
+    """Measure a sample of event cards to estimate how many fit on a page."""
     base_events_per_page = CONFIG.get("events_per_page", 8)
 
     if not _events:
@@ -438,7 +683,7 @@ def get_events_per_page():
         return base_events_per_page
 
     available_height = int(events_region.height)
-    event_spacing = int(CONFIG.get("EVENT_SPACING", 2))
+    event_spacing = _event_spacing
 
     sample_size = min(8, len(_events))
     sample_heights = []
@@ -467,65 +712,77 @@ def get_events_per_page():
 
     return max(4, min(15, practical_fit))
 
-def get_adaptive_refresh_interval():
-    """Adjust refresh rate based on upcoming events and time of day."""
-    now = utime.time()
-    hour = utime.localtime(now)[3]
+def get_next_event_start(now):
+    """Return the soonest start of a non-canceled timed event after now, or None."""
+    cached = _next_start_cache
+    if cached["rev"] == _events_rev and (cached["ts"] is None or cached["ts"] > now):
+        return cached["ts"]
+    
+    next_start = None
+    for event in _events:
+        start_ts = event.dtstart
+        if start_ts > now and (next_start is None or start_ts < next_start):
+            (_, _, _, multi_day, all_day, is_canceled, _, _, _, _, _) = get_event_meta(event)
+            if not is_canceled and not (multi_day or all_day):
+                next_start = start_ts
+    
+    cached["rev"] = _events_rev
+    cached["ts"] = next_start
+    return next_start
+
+def get_adaptive_refresh_interval(now=None):
+    """Adjust refresh rate based on time of day and the next timed event."""
+    if now is None:
+        now = utime.time()
+    hour = get_local_hour(now)
     
     if 8 <= hour <= 18:
-        base_interval = CONFIG.get("REFRESH_INTERVAL", 900)
+        base_interval = _refresh_interval
     else:
-        base_interval = CONFIG.get("REFRESH_INTERVAL", 900) * 2
-
-    if _events:
-        next_event_time = None
-        for event in _events[:3]:
-            event_info = get_event_type_and_state(event, now)
-            if (not event_info['is_canceled'] and 
-                event_info['is_timed'] and 
-                event.dtstart > now):
-                next_event_time = event.dtstart
-                break
-        
-        if next_event_time:
-            time_until = next_event_time - now
-            if time_until <= 1800:  # Next 30 minutes
-                return base_interval // 2
+        base_interval = _refresh_interval * 2
+
+    # Poll more often as the next event approaches, but at most once a minute
+    next_start = get_next_event_start(now)
+    if next_start is not None:
+        return max(60, min(base_interval, (next_start - now) // 8))
     
     return base_interval
 
 # === CONTENT HASHING FOR PARTIAL UPDATES ===
+_FNV_OFFSET_BASIS = 2166136261
+_FNV_PRIME = 16777619
+
+def fnv_mix(h, value):
+    """Fold an integer (or bool) into a 32-bit FNV-1a hash."""
+    return ((h ^ (value & 0xFFFFFFFF)) * _FNV_PRIME) & 0xFFFFFFFF
+
 def calculate_content_hash(region_name, data=None):
     """Calculate a simple hash for region content to detect changes."""
+    h = _FNV_OFFSET_BASIS
     if region_name == "header":
-        return hash((_last_refresh, CONFIG.get("SHOW_MEMORY", False)))
+        h = fnv_mix(h, _last_refresh)
+        return fnv_mix(h, _show_memory)
     elif region_name in ["pagination_left", "pagination_right"]:
-        per_page = get_events_per_page()
-        total_pages = (len(_events) + per_page - 1) // per_page
-        return hash((_current_page, total_pages))
+        h = fnv_mix(h, _current_page)
+        return fnv_mix(h, get_page_count())
     elif region_name == "status":
-        return hash((_network_status["connected"], _network_status["error_count"], 
-                    _network_status["last_error"], _network_status["last_success"]))
+        h = fnv_mix(h, _network_status["connected"])
+        h = fnv_mix(h, _network_status["error_count"])
+        h = fnv_mix(h, _network_status["last_error"])
+        return fnv_mix(h, _network_status["last_success"])
     elif region_name == "events":
-        per_page = get_events_per_page()
-        start_idx = _current_page * per_page
-        end_idx = start_idx + per_page
-        page_events = _events[start_idx:end_idx]
-        now_ts = utime.time()
-        events_data = []
-        for e in page_events:
-            events_data.append((e.dtstart, e.dtend, e.summary, 
-                              e.description, now_ts // 60))
-        return hash(tuple(events_data))
+        # Events only change on reload; the minute keeps ongoing state fresh
+        h = fnv_mix(h, _events_rev)
+        h = fnv_mix(h, _current_page)
+        return fnv_mix(h, utime.time() // 60)
     elif region_name == "memory":
-        if CONFIG.get("SHOW_MEMORY", False):
-            now_ts = utime.time()
+        if _show_memory:
             mem_stats = get_memory_stats()
-            time_component = now_ts // 10
-            return hash((mem_stats['free_pct'], time_component))
-        return hash((0,))
+            h = fnv_mix(h, int(mem_stats['free_pct'] * 100))
+            return fnv_mix(h, utime.time() // 10)
+        return fnv_mix(h, 0)
     elif region_name == "refresh":
-        return hash((_last_refresh,))
+        return fnv_mix(h, _last_refresh)
     return 0
 
 # === REGION DRAWING FUNCTIONS ===
@@ -537,7 +794,7 @@ def draw_header_region(region):
     title = CONFIG.get("TITLE_TEXT", "Calendar")
     title_h = int(CONFIG.get("TITLE_FONT_HEIGHT", 32))
     
-    vector.set_font_size(title_h)
+    set_font_size(title_h)
     title_w, title_measured_h = get_text_metrics(title)
     
     x = region.x + (region.width - title_w) // 2
@@ -546,7 +803,7 @@ def draw_header_region(region):
     display.set_pen(THEME["HEADER_TEXT_COLOR"])
     vector.text(title, int(x), int(y))
     
-    vector.set_font_size(int(CONFIG.get("FONT_HEIGHT", 8)))
+    set_font_size(int(CONFIG.get("FONT_HEIGHT", 8)))
 
 def draw_refresh_region(region):
     """Draw refresh time."""
@@ -569,7 +826,7 @@ def draw_memory_region(region):
     display.set_pen(THEME["HEADER_BG_COLOR"])
     display.rectangle(int(region.x), int(region.y), int(region.width), int(region.height))
     
-    if not CONFIG.get("SHOW_MEMORY", False):
+    if not _show_memory:
         return
         
     mem_stats = get_memory_stats()
@@ -603,8 +860,7 @@ def draw_pagination_right_region(region):
     display.set_pen(THEME["HEADER_BG_COLOR"])
     display.rectangle(int(region.x), int(region.y), int(region.width), int(region.height))
     
-    per_page = get_events_per_page()
-    total_pages = (len(_events) + per_page - 1) // per_page
+    total_pages = get_page_count()
     remaining_after = max(0, total_pages - _current_page - 1)
     
     if remaining_after > 0:
@@ -644,91 +900,45 @@ def draw_status_region(region):
         display.set_pen(0x07E0)  # Green
         vector.text("✓", int(x), int(y))
 
-def draw_event_card(idx, e, y, now_ts):
+def draw_event_card(idx, e, y, now_ts, now_display_ts):
     """Draw event card with theme-based colors."""
-    display_tz = CONFIG.get("display_tz", CONFIG.get("default_tz", "America/Los_Angeles"))
-    
-    duration = e.dtend - e.dtstart
+    (_, _, duration, multi_day, all_day, is_canceled,
+     start_display_ts, _, _, time_str, title) = get_event_meta(e)
     start_ts = e.dtstart
-    start_local = ical_parser.convert_to_local(start_ts, display_tz)
-    end_local = ical_parser.convert_to_local(e.dtend, display_tz)
-    
-    sd, ed = start_local[:3], end_local[:3]
-    multi_day = (sd != ed)
-    all_day = not multi_day and duration >= 86400
     
     # Determine state
-    now_display_tz = ical_parser.convert_to_local(now_ts, display_tz)
-    now_display_ts = utime.mktime(now_display_tz[:6] + (0, 0, 0))
-    start_display_ts = utime.mktime(start_local[:6] + (0, 0, 0))
     ongoing = (start_display_ts <= now_display_ts <= start_display_ts + duration)
               
-    # Format time string
-    if multi_day:
-        time_str = format_time_tuple(start_local,'%m/%d') + "-" + format_time_tuple(end_local,'%m/%d') + " Multi-Day"
-    elif all_day:
-        time_str = format_time_tuple(start_local, '%m/%d') + " All-Day"
-    else:
-        duration_minutes = duration // 60
-        time_str = format_time_tuple(start_local, '%m/%d %H:%M') + f" {duration_minutes}min"
-        
-    title = str(e.summary if e.summary is not None else 'Untitled')
-    desc = e.description if e.description is not None else ''
-    
-    _, line_height = get_text_metrics()
-    line_spacing = int(CONFIG.get("LINE_SPACING", 4))
-    padding = int(CONFIG.get("CARD_PADDING", 8))
-    
-    # Include short description if available
-    desc_lines = []
-    if desc and len(desc) < 50:
-        desc_text = desc[:40] + "…" if len(desc) > 40 else desc
-        desc_lines = [desc_text]
+    line_height = _line_height
+    line_spacing = _line_spacing
+    padding = _card_padding
     
-    # Calculate card height
-    total_lines = 2 + len(desc_lines)
-    card_height = int(padding + (total_lines * line_height) + ((total_lines - 1) * line_spacing) + padding)
+    # Card height, including a short description line if available
+    card_height, has_desc_line = card_geometry(e)
+    card_height = int(card_height)
     
-    # Check if event is canceled
-    is_canceled = get_event_type_and_state(e, now_ts)['is_canceled']
-
     # Background and styling
-    bg_pen = THEME["ROW_BG_COLOR_ODD"] if idx % 2 == 0 else THEME["ROW_BG_COLOR_EVEN"]
+    bg_pen = _row_bg_pens[idx % 2]
 
     if is_canceled:
-        border_pen = THEME["PAST_ACCENT"]
-        text_pen = THEME["EVENT_TEXT_CANCELED"]
-        desc_pen = THEME["EVENT_DESC_CANCELED"]
+        state = _CARD_CANCELED
     elif ongoing:
-        border_pen = THEME["ONGOING_ACCENT"]
-        text_pen = THEME["EVENT_TEXT_ONGOING"]
-        desc_pen = THEME["EVENT_DESC_ONGOING"]
+        state = _CARD_ONGOING
     elif all_day or multi_day:
-        border_pen = THEME["ALLDAY_ACCENT"]
-        text_pen = THEME["EVENT_TEXT_ALLDAY"]
-        desc_pen = THEME["EVENT_DESC_ALLDAY"]
+        state = _CARD_ALLDAY
     elif start_ts > now_ts:
-        border_pen = THEME["FUTURE_ACCENT"]
-        text_pen = THEME["EVENT_TEXT_FUTURE"]
-        desc_pen = THEME["EVENT_DESC_FUTURE"]
+        state = _CARD_FUTURE
     else:
-        border_pen = THEME["PAST_ACCENT"]
-        text_pen = THEME["EVENT_TEXT_PAST"]
-        desc_pen = THEME["EVENT_DESC_PAST"]
+        state = _CARD_PAST
+    border_pen, text_pen, desc_pen = _card_pens[state]
         
     # Draw background and borders
     display.set_pen(bg_pen)
-    card_box = Polygon()
-    card_box.rectangle(0, int(y), WIDTH, card_height)
-    vector.draw(card_box)
+    display.rectangle(0, int(y), WIDTH, card_height)
 
     display.set_pen(border_pen)
-    top_border = Polygon()
-    top_border.rectangle(0, int(y), WIDTH, 2)
-    vector.draw(top_border)
-    bottom_border = Polygon()
-    bottom_border.rectangle(0, int(y) + card_height - 2, WIDTH, 2)
-    vector.draw(bottom_border)
+    display.rectangle(0, int(y), WIDTH, 2)
+    display.rectangle(0, int(y) + card_height - 2, WIDTH, 2)
 
     # Draw text
     text_x = 8
@@ -740,31 +950,34 @@ def draw_event_card(idx, e, y, now_ts):
     current_y += line_height + line_spacing
     vector.text(title, text_x, current_y)
 
-    if desc_lines:
+    if has_desc_line:
+        desc = e.description
         current_y += line_height + line_spacing
         display.set_pen(desc_pen)
-        vector.text(desc_lines[0], text_x, current_y)
+        vector.text(desc[:40] + "…" if len(desc) > 40 else desc, text_x, current_y)
 
-    return card_height + int(CONFIG.get("EVENT_SPACING", 2))
+    return card_height + _event_spacing
 
 def draw_events_region(region):
     """Draw all events in the events region."""
     now_ts = utime.time()
+    now_display_ts = get_display_now_ts(now_ts)
     per_page = get_events_per_page()
     start_idx = _current_page * per_page
-    end_idx = start_idx + per_page
-    page_events = _events[start_idx:end_idx]
+    end_idx = min(start_idx + per_page, len(_events))
     
+    event_spacing = _event_spacing
     y = int(region.y)
-    for idx, ev in enumerate(page_events):
-        event_height = draw_event_card(idx, ev, y, now_ts)
-        y += int(event_height + CONFIG.get("EVENT_SPACING", 2))
+    for idx in range(start_idx, end_idx):
+        event_height = draw_event_card(idx - start_idx, _events[idx], y, now_ts, now_display_ts)
+        y += int(event_height + event_spacing)
 
 def display_events_with_partial_updates(events, page, refresh_timestamp):
     """Display events using partial updates."""
-    global _events, _current_page, _last_refresh
+    global _events, _current_page, _last_refresh, _redraw_pending, _last_frame_ms
 
     _events = events
+    _events_per_page_cache["events_id"] = None
     _current_page = page
     _last_refresh = refresh_timestamp
 
@@ -779,14 +992,19 @@ def display_events_with_partial_updates(events, page, refresh_timestamp):
     }
 
     # Check which regions need updating
+    now = utime.time()
     regions_to_update = []
     for region_name, region in REGIONS.items():
+        # Skip hashing regions updated too recently; the change is picked up later
+        if not region.is_dirty() and region.is_rate_limited(now):
+            continue
         content_hash = calculate_content_hash(region_name)
         if region.set_content_hash(content_hash) or region.is_dirty():
             regions_to_update.append(region_name)
 
     # Force full update if no events or many regions are dirty
-    if not events or len(regions_to_update) >= 4:
+    full_redraw = not events or len(regions_to_update) >= 4
+    if full_redraw:
         display.set_pen(THEME["BG_COLOR"])
         display.clear()
         mark_all_regions_dirty()
@@ -795,118 +1013,166 @@ def display_events_with_partial_updates(events, page, refresh_timestamp):
     # Update only dirty regions
     for region_name in regions_to_update:
         if region_name in region_functions:
-            update_region(region_name, region_functions[region_name])
+            update_region(region_name, region_functions[region_name], force=full_redraw, clear=not full_redraw, now=now)
 
     presto.update()
-    gc.collect()
+    _redraw_pending = False
+    _last_frame_ms = utime.ticks_ms()
+    collect_garbage_if_needed()
     
 # === LED AND BACKLIGHT MANAGEMENT ===
-def update_led_status(events, now_ts):
-    """Update LED status based on current/upcoming events."""
-    relevant_events = [e for e in events if not get_event_type_and_state(e, now_ts)['is_canceled']]
-    
-    if not relevant_events:
-        presto.set_led_rgb(0, 0, 0, 0)
-        presto.set_led_rgb(1, 0, 0, 0)
+def set_led_hsv(index, h, s, v):
+    """Set an LED by HSV, skipping the write if it already shows that colour."""
+    key = ("hsv", h, s, v)
+    if _last_led[index] == key:
+        return
+    presto.set_led_hsv(index, h, s, v)
+    _last_led[index] = key
+
+def set_led_rgb(index, r, g, b):
+    """Set an LED by RGB, skipping the write if it already shows that colour."""
+    key = ("rgb", r, g, b)
+    if _last_led[index] == key:
         return
+    presto.set_led_rgb(index, r, g, b)
+    _last_led[index] = key
 
+def set_backlight(level):
+    """Set the backlight, skipping the write if the level is unchanged."""
+    global _last_backlight
+    if _last_backlight == level:
+        return
+    presto.set_backlight(level)
+    _last_backlight = level
+
+def scan_event_status(events, now_ts):
+    """Scan events once for both the LED and backlight decisions.
+    
+    Returns (current_event, next_timed_event, should_dim) where current_event
+    is the first ongoing event among the first 5 non-canceled events,
+    next_timed_event is the soonest upcoming timed event among the first 10
+    non-canceled events, and should_dim is False when one of the first 5
+    events is a timed event that is ongoing or starts within the hour.
+    """
     current_event = None
     next_timed_event = None
+    should_dim = True
+    relevant_count = 0
+    now_display_ts = get_display_now_ts(now_ts)
     
-    # Check for ongoing event
-    for event in relevant_events[:5]:
-        event_info = get_event_type_and_state(event, now_ts)
-        if event_info['ongoing']:
-            current_event = event
+    for idx in range(len(events)):
+        if idx >= 5 and relevant_count >= 10:
             break
-    
-    # Find next timed event
-    for event in relevant_events[:10]:
-        event_info = get_event_type_and_state(event, now_ts)
+        event = events[idx]
+        event_info = get_event_type_and_state(event, now_ts, now_display_ts)
+        is_canceled = event_info['is_canceled']
+        is_timed = event_info['is_timed']
         
-        if not event_info['is_timed']:
+        # Backlight: keep bright around ongoing or imminent timed events
+        if (idx < 5 and should_dim and not is_canceled and is_timed and
+                event.dtend >= now_ts):
+            if event_info['ongoing'] or (event.dtstart > now_ts and (event.dtstart - now_ts) <= 3600):
+                should_dim = False
+        
+        if is_canceled or relevant_count >= 10:
             continue
-            
-        if event.dtstart > now_ts:
+        
+        # LEDs: first ongoing event, then soonest upcoming timed event
+        if current_event is None and relevant_count < 5 and event_info['ongoing']:
+            current_event = event
+        if is_timed and event.dtstart > now_ts:
             if not next_timed_event or event.dtstart < next_timed_event.dtstart:
                 next_timed_event = event
+        relevant_count += 1
+    
+    return current_event, next_timed_event, should_dim
+
+def update_indicators(events, now_ts):
+    """Update LEDs and backlight from a single scan of the events."""
+    current_event, next_timed_event, should_dim = scan_event_status(events, now_ts)
+    apply_led_status(current_event, next_timed_event, now_ts)
+    update_backlight(events, now_ts, should_dim)
+
+def update_led_status(events, now_ts):
+    """Update LED status based on current/upcoming events."""
+    current_event, next_timed_event, _ = scan_event_status(events, now_ts)
+    apply_led_status(current_event, next_timed_event, now_ts)
 
+def apply_led_status(current_event, next_timed_event, now_ts):
+    """Set the LEDs for the ongoing or next timed event."""
+    global _blink_phase, _blink_next_ms
+    
     if current_event:
         current_info = get_event_type_and_state(current_event, now_ts)
         
         if current_info['multi_day']:
-            presto.set_led_hsv(0, 0.83, 1.0, 0.7)  # Purple
-            presto.set_led_hsv(1, 0.83, 1.0, 0.7)
+            set_led_hsv(0, 0.83, 1.0, 0.7)  # Purple
+            set_led_hsv(1, 0.83, 1.0, 0.7)
         elif current_info['all_day']:
-            presto.set_led_hsv(0, 0.67, 1.0, 0.6)  # Blue
-            presto.set_led_hsv(1, 0.67, 1.0, 0.6)
+            set_led_hsv(0, 0.67, 1.0, 0.6)  # Blue
+            set_led_hsv(1, 0.67, 1.0, 0.6)
         else:
-            presto.set_led_hsv(0, 0.33, 1.0, 0.8)  # Green
-            presto.set_led_hsv(1, 0.33, 1.0, 0.8)
+            set_led_hsv(0, 0.33, 1.0, 0.8)  # Green
+            set_led_hsv(1, 0.33, 1.0, 0.8)
             
     elif next_timed_event:
         time_until = next_timed_event.dtstart - now_ts
         if time_until <= 900:  # 15 minutes
-            brightness = 0.5 + 0.3 * ((utime.ticks_ms() // 500) % 2)
-            presto.set_led_hsv(0, 0.0, 1.0, brightness)
-            presto.set_led_hsv(1, 0.0, 1.0, brightness)
+            # Flip the blink phase on its own 500ms deadline
+            now_ms = utime.ticks_ms()
+            if utime.ticks_diff(now_ms, _blink_next_ms) >= 0:
+                _blink_phase ^= 1
+                _blink_next_ms = utime.ticks_add(now_ms, 500)
+            brightness = 0.5 + 0.3 * _blink_phase
+            set_led_hsv(0, 0.0, 1.0, brightness)
+            set_led_hsv(1, 0.0, 1.0, brightness)
         elif time_until <= 3600:  # 1 hour
-            presto.set_led_hsv(0, 0.08, 1.0, 0.6)  # Orange
-            presto.set_led_hsv(1, 0.08, 1.0, 0.6)
+            set_led_hsv(0, 0.08, 1.0, 0.6)  # Orange
+            set_led_hsv(1, 0.08, 1.0, 0.6)
         else:
-            presto.set_led_hsv(0, 0.67, 0.8, 0.3)
-            presto.set_led_hsv(1, 0.67, 0.8, 0.3)
+            set_led_hsv(0, 0.67, 0.8, 0.3)
+            set_led_hsv(1, 0.67, 0.8, 0.3)
     else:
-        presto.set_led_rgb(0, 0, 0, 0)
-        presto.set_led_rgb(1, 0, 0, 0)
+        set_led_rgb(0, 0, 0, 0)
+        set_led_rgb(1, 0, 0, 0)
 
 def should_dim_backlight(events, now_ts):
     """Check if backlight should be dimmed."""
-    for event in events[:5]:
-        event_info = get_event_type_and_state(event, now_ts)
-        
-        if (event.dtend < now_ts or
-            event_info['is_canceled'] or 
-            not event_info['is_timed']):
-            continue
-        
-        if event_info['ongoing']:
-            return False
-            
-        if event.dtstart > now_ts and (event.dtstart - now_ts) <= 3600:
-            return False
-    
-    return True
+    return scan_event_status(events, now_ts)[2]
 
-def update_backlight(events, now_ts):
+def update_backlight(events, now_ts, should_dim=None):
     """Update backlight based on event status and activity."""
-    global _backlight_dimmed, _backlight_check_interval
+    global _backlight_dimmed, _backlight_next_check_ms
     
-    if now_ts - _backlight_check_interval < 5:
+    # Re-evaluate at most every 5 s, on the monotonic tick clock
+    now_ms = utime.ticks_ms()
+    if utime.ticks_diff(_backlight_next_check_ms, now_ms) > 0:
         return
-    _backlight_check_interval = now_ts
+    _backlight_next_check_ms = utime.ticks_add(now_ms, 5000)
     
-    should_dim = should_dim_backlight(events, now_ts)
+    if should_dim is None:
+        should_dim = should_dim_backlight(events, now_ts)
     time_since_activity = now_ts - _last_activity
     
     if should_dim and time_since_activity > 30 and not _backlight_dimmed:
         try:
-            presto.set_backlight(0.1)
+            set_backlight(0.1)
             _backlight_dimmed = True
         except Exception as e:
             print(f"Backlight dim failed: {e}")
     elif (not should_dim or time_since_activity <= 30) and _backlight_dimmed:
         try:
-            presto.set_backlight(1.0)
+            set_backlight(1.0)
             _backlight_dimmed = False
         except Exception as e:
             print(f"Backlight brighten failed: {e}")
 
 # === NETWORK STATUS TRACKING ===
-def update_network_status(success, error_msg=""):
+def update_network_status(success, error_msg="", now=None):
     """Track network status for display."""
     global _network_status
-    now = utime.time()
+    if now is None:
+        now = utime.time()
     
     if success:
         _network_status["connected"] = True
@@ -917,57 +1183,82 @@ def update_network_status(success, error_msg=""):
         _network_status["connected"] = False
         _network_status["last_error"] = now
         _network_status["error_count"] += 1
-        print(f"Network status: ERROR ({error_msg}) - Count: {_network_status['error_count']}")
+        _dbg("Network status: ERROR (", error_msg, ") - Count:", _network_status["error_count"])
         mark_region_dirty("status")
 
 # === SCREEN SLEEP MANAGEMENT ===
-def should_enter_screen_sleep():
+# Burn-in prevention: nudge the sleep text every minute and flash the
+# screen inverted for SLEEP_INVERT_HOLD_MS once every SLEEP_INVERT_EVERY shifts
+SLEEP_SHIFT_SECONDS = 60
+SLEEP_INVERT_EVERY = 30
+SLEEP_INVERT_HOLD_MS = 1000
+
+def should_enter_screen_sleep(now=None):
     """Determine if device should enter screen sleep mode."""
-    now = utime.time()
-    hour = utime.localtime(now)[3]
+    if now is None:
+        now = utime.time()
+    hour = get_local_hour(now)
     
-    sleep_start = CONFIG.get("SLEEP_START_HOUR", 23)
-    sleep_end = CONFIG.get("SLEEP_END_HOUR", 6)
+    sleep_start = _sleep_start_hour
+    sleep_end = _sleep_end_hour
     
     if sleep_start < sleep_end:
         in_sleep_hours = sleep_start <= hour < sleep_end
     else:
         in_sleep_hours = hour >= sleep_start or hour < sleep_end
     
-    inactivity_timeout_minutes = CONFIG.get("SLEEP_INACTIVITY_MINUTES", 60)
     time_since_activity = now - _last_activity
-    no_recent_activity = time_since_activity > (inactivity_timeout_minutes * 60)
+    no_recent_activity = time_since_activity > _sleep_inactivity_s
     
     return in_sleep_hours and no_recent_activity
 
-def enter_screen_sleep():
+def enter_screen_sleep(now=None):
     """Enter screen sleep mode."""
     global _screen_sleep_state
     
+    if now is None:
+        now = utime.time()
     print("Entering screen sleep mode")
     _screen_sleep_state["active"] = True
-    _screen_sleep_state["sleep_start_time"] = utime.time()
-    
-    presto.set_backlight(0.05)
-    presto.set_led_rgb(0, 0, 0, 0)
-    presto.set_led_rgb(1, 0, 0, 0)
-    
-    update_sleep_display()
-    
-def update_sleep_display():
+    _screen_sleep_state["sleep_start_time"] = now
+    _screen_sleep_state["text_bbox"] = None
+    _screen_sleep_state["inverted_shift"] = None
+    
+    set_backlight(0.05)
+    set_led_rgb(0, 0, 0, 0)
+    set_led_rgb(1, 0, 0, 0)
+    
+    update_sleep_display(now)
+    
+def get_sleep_metrics(sleep_text, wake_text):
+    """Widths of the sleep screen strings and the line height, cached per font size."""
+    if _sleep_metrics_cache["font_size"] == font_size:
+        return _sleep_metrics_cache["value"]
+    metrics = (get_text_metrics(sleep_text)[0], get_text_metrics(wake_text)[0], get_text_metrics("M")[1])
+    _sleep_metrics_cache["font_size"] = font_size
+    _sleep_metrics_cache["value"] = metrics
+    return metrics
+
+def update_sleep_display(now=None):
     """Update sleep display with burn-in prevention."""
-    display.set_pen(THEME["BG_COLOR"])
-    display.clear()
-
-    display.set_pen(_sleep_text_pen)
-    
-    # Calculate burn-in prevention offset
-    now = utime.time()
-    time_in_sleep = now - _screen_sleep_state["sleep_start_time"]
-    offset_cycle = int(time_in_sleep // 180) % 4
-    
-    offset_x = (offset_cycle % 2) * 50 - 25
-    offset_y = (offset_cycle // 2) * 30 - 15
+    # Calculate burn-in prevention offset: a few pixels, changing every minute
+    if now is None:
+        now = utime.time()
+    time_in_sleep = int(now - _screen_sleep_state["sleep_start_time"])
+    shift = time_in_sleep // SLEEP_SHIFT_SECONDS
+    
+    offset_x = shift % 7 - 3
+    offset_y = (time_in_sleep // 75) % 5 - 2
+    
+    # Swap background and text for a single short frame in every
+    # SLEEP_INVERT_EVERY shifts; the redraw after it restores the colours
+    inverted = (shift % SLEEP_INVERT_EVERY == SLEEP_INVERT_EVERY - 1
+                and _screen_sleep_state["inverted_shift"] != shift)
+    if inverted:
+        _screen_sleep_state["inverted_shift"] = shift
+        bg_pen, text_pen = _sleep_text_pen, THEME["BG_COLOR"]
+    else:
+        bg_pen, text_pen = THEME["BG_COLOR"], _sleep_text_pen
     
     center_x = WIDTH // 2 + offset_x
     center_y = HEIGHT // 2 + offset_y
@@ -975,22 +1266,55 @@ def update_sleep_display():
     sleep_text = "Sleep Mode"
     wake_text = "Touch to wake"
     
-    sleep_w, _ = get_text_metrics(sleep_text)
-    wake_w, _ = get_text_metrics(wake_text)
-    char_h = get_text_metrics("M")[1]
+    sleep_w, wake_w, char_h = get_sleep_metrics(sleep_text, wake_text)
     
     sleep_x = max(5, min(WIDTH - sleep_w - 5, center_x - sleep_w // 2))
     wake_x = max(5, min(WIDTH - wake_w - 5, center_x - wake_w // 2))
     sleep_y = max(char_h, min(HEIGHT - char_h * 3, center_y - char_h))
     wake_y = max(char_h * 2, min(HEIGHT - char_h, center_y + char_h))
     
+    # Bounding box of both lines, with a line of slack above the first baseline
+    bbox = (
+        min(sleep_x, wake_x),
+        max(0, sleep_y - char_h),
+        min(WIDTH, max(sleep_x + sleep_w, wake_x + wake_w) + 1),
+        min(HEIGHT, wake_y + char_h),
+    )
+    prev_bbox = _screen_sleep_state["text_bbox"]
+    partial_update = getattr(presto, "partial_update", None)
+    
+    display.set_pen(bg_pen)
+    if inverted or prev_bbox is None or partial_update is None:
+        display.clear()
+        dirty = None
+    else:
+        # Only the text moved; erase where it was
+        display.rectangle(prev_bbox[0], prev_bbox[1], prev_bbox[2] - prev_bbox[0], prev_bbox[3] - prev_bbox[1])
+        dirty = (
+            min(bbox[0], prev_bbox[0]),
+            min(bbox[1], prev_bbox[1]),
+            max(bbox[2], prev_bbox[2]),
+            max(bbox[3], prev_bbox[3]),
+        )
+
+    display.set_pen(text_pen)
     vector.text(sleep_text, sleep_x, sleep_y)
     vector.text(wake_text, wake_x, wake_y)
-    presto.update()
+    
+    if dirty is None:
+        presto.update()
+    else:
+        partial_update(dirty[0], dirty[1], dirty[2] - dirty[0], dirty[3] - dirty[1])
+    
+    # An inverted frame covers the whole screen, so the next one must too,
+    # and it is only held briefly so a dark room never gets a bright minute
+    _screen_sleep_state["text_bbox"] = None if inverted else bbox
+    delay_ms = SLEEP_INVERT_HOLD_MS if inverted else SLEEP_SHIFT_SECONDS * 1000
+    _screen_sleep_state["next_update_ms"] = utime.ticks_add(utime.ticks_ms(), delay_ms)
     
 def exit_screen_sleep():
     """Exit screen sleep mode."""
-    global _screen_sleep_state
+    global _screen_sleep_state, _backlight_dimmed
 
     if not _screen_sleep_state["active"]:
         return
@@ -999,7 +1323,9 @@ def exit_screen_sleep():
     _screen_sleep_state["active"] = False
 
     mark_activity()
-    presto.set_backlight(1.0)
+    set_backlight(1.0)
+    # Full brightness is restored here, so the dimming logic must not redo it
+    _backlight_dimmed = False
     mark_all_regions_dirty()
 
     utime.sleep_ms(100)
@@ -1007,9 +1333,9 @@ def exit_screen_sleep():
     gc.collect()
 
 # === AUDIO AND ALERTS ===
-def buzz(pattern):
+def buzz(pattern, now=None):
     """Play buzzer pattern."""
-    if in_quiet_hours(utime.time()):
+    if in_quiet_hours(utime.time() if now is None else now):
         return
     for idx, duration in enumerate(pattern):
         if idx % 2 == 0:
@@ -1019,70 +1345,88 @@ def buzz(pattern):
         utime.sleep_ms(duration)
     buzzer.set_tone(-1)
 
-def check_alerts(events, now_ts):
-    """Check for event alerts."""
-    for ev in events:
-        if not hasattr(ev, "alert_fired"):
-            ev.alert_fired = False
+def get_alert_queue(events):
+    """Timed, non-canceled events as (alert_time, event), ordered by alert time."""
+    # Compare the list itself rather than id(): a refreshed list can be
+    # allocated at the address of the freed one
+    if _alert_queue_cache["events"] is events:
+        return _alert_queue_cache["queue"]
 
-        if ev.alert_fired:
+    queue = []
+    for ev in events:
+        if ev.dtstart is None:
             continue
-
-        event_info = get_event_type_and_state(ev, now_ts)
-
-        if (event_info['is_canceled'] or not event_info['is_timed']): 
+        meta = get_event_meta(ev)
+        # Skip multi-day, all-day and canceled events
+        if meta[3] or meta[4] or meta[5]:
             continue
+        queue.append((ev.dtstart - getattr(ev, "alert_offset", 300), ev))
+    queue.sort(key=lambda item: item[0])
 
-        start_ts = ev.dtstart
-        if start_ts is None:
-            continue
+    _alert_queue_cache["events"] = events
+    _alert_queue_cache["queue"] = queue
+    _alert_queue_cache["next"] = 0
+    return queue
 
-        offset = getattr(ev, "alert_offset", 300) 
-        alert_time = start_ts - offset
-        if now_ts >= alert_time:
-            buzz(CONFIG.get("BUZZ_PATTERN", [200, 100, 200]))
+def check_alerts(events, now_ts):
+    """Check for event alerts."""
+    queue = get_alert_queue(events)
+
+    # Everything before the cursor has already been handled; stop at the
+    # first alert that is not due yet since the rest come later
+    i = _alert_queue_cache["next"]
+    count = len(queue)
+    while i < count:
+        alert_time, ev = queue[i]
+        if now_ts < alert_time:
+            break
+        if not getattr(ev, "alert_fired", False):
+            buzz(_buzz_pattern, now_ts)
             ev.alert_fired = True
+        i += 1
+    _alert_queue_cache["next"] = i
 
 # === TOUCH HANDLING ===
+# Pull-to-refresh animation frames as (caption, spinner glyph)
+_REFRESH_FRAMES = (
+    ("Refreshing.", "|"),
+    ("Refreshing..", "/"),
+    ("Refreshing...", "-"),
+    ("Loading events...", "\\"),
+)
+
 def animate_pull_to_refresh():
     """Animate pull-to-refresh action."""
     region = REGIONS["events"]
 
-    refresh_frames = [
-        "Refreshing.",
-        "Refreshing..",
-        "Refreshing...",
-        "Loading events..."
-    ]
-
     center_x = int(WIDTH // 2)
     center_y = int(region.y + region.height // 2)
 
-    for i, frame in enumerate(refresh_frames):
-        display.set_pen(THEME["BG_COLOR"])
-        clear_rect = Polygon()
-        clear_rect.rectangle(int(region.x), int(region.y), int(region.width), int(region.height))
-        vector.draw(clear_rect)
+    # The cleared area and pens are the same for every frame
+    rx, ry = int(region.x), int(region.y)
+    rw, rh = int(region.width), int(region.height)
+    bg_pen = THEME["BG_COLOR"]
+    text_pen = THEME["TEXT_COLOR"]
+
+    for frame, spinner_char in _REFRESH_FRAMES:
+        display.set_pen(bg_pen)
+        display.rectangle(rx, ry, rw, rh)
 
-        display.set_pen(THEME["TEXT_COLOR"])
+        display.set_pen(text_pen)
         text_width, _ = get_text_metrics(frame)
         x = int(max(region.x, center_x - text_width // 2))
         y = int(center_y - 20)
         vector.text(frame, x, y)
 
-        spinner_chars = ["|", "/", "-", "\\"]
-        spinner_char = spinner_chars[i % 4]
         vector.text(spinner_char, center_x, int(center_y + 10))
 
         presto.update()
         utime.sleep_ms(300)
 
-    display.set_pen(THEME["BG_COLOR"])
-    clear_rect = Polygon()
-    clear_rect.rectangle(int(region.x), int(region.y), int(region.width), int(region.height))
-    vector.draw(clear_rect)
+    display.set_pen(bg_pen)
+    display.rectangle(rx, ry, rw, rh)
 
-    display.set_pen(THEME["TEXT_COLOR"])
+    display.set_pen(text_pen)
     final_text = "Updating..."
     text_width, _ = get_text_metrics(final_text)
     x = int(max(region.x, center_x - text_width // 2))
@@ -1097,6 +1441,12 @@ def handle_touch():
     global _initial_touch_x, _initial_touch_y
 
     touch.poll()
+
+    # Idle fast path: nothing pressed and no gesture in progress, so skip
+    # building the touch_a tuple and resetting the tracking state
+    if _last_touch is None and _TOUCH_HAS_STATE and not touch.state:
+        return
+
     data = presto.touch_a
 
     if data is None or not isinstance(data, tuple) or len(data) != 3:
@@ -1120,8 +1470,10 @@ def handle_touch():
         if _last_touch and _initial_touch_x is not None:
             time_since_initial = utime.ticks_diff(current_read_ms, _last_touch[2])
             if time_since_initial < 50:  # Reduced from 100ms to 50ms
-                distance_from_initial = ((x - _initial_touch_x) ** 2 + (y - _initial_touch_y) ** 2) ** 0.5
-                if distance_from_initial < 5:
+                # Within 5px of the initial point; compare squared to skip the sqrt
+                ddx = x - _initial_touch_x
+                ddy = y - _initial_touch_y
+                if ddx * ddx + ddy * ddy < 25:
                     return
 
         mark_activity()
@@ -1134,7 +1486,7 @@ def handle_touch():
         # Restore backlight
         if _backlight_dimmed:
             try:
-                presto.set_backlight(1.0)
+                set_backlight(1.0)
                 _backlight_dimmed = False
             except Exception as e:
                 print(f"Error brightening backlight: {e}")
@@ -1190,7 +1542,7 @@ def handle_touch():
 
     if abs_dx > abs_dy * gesture_ratio:
         # Horizontal swipe - pagination (OPTIMIZED)
-        pages = (len(_events) + get_events_per_page() - 1) // get_events_per_page()
+        pages = get_page_count()
         if pages > 1:
             old_page = _current_page
             if dx < 0:  # Left swipe - next page
@@ -1200,12 +1552,8 @@ def handle_touch():
             
             # Only update if page actually changed
             if old_page != _current_page:
-                # OPTIMIZATION: Only mark essential regions dirty for pagination
-                mark_region_dirty("events")
-                mark_region_dirty("pagination_left")
-                mark_region_dirty("pagination_right")
-                # Remove header update - not needed for simple pagination
-                display_events_with_partial_updates(_events, _current_page, _last_refresh)
+                # Defer drawing to the main loop so quick swipes stay responsive
+                request_redraw("events", "pagination_left", "pagination_right")
         
         # Clear touch state immediately for next gesture
         _last_touch = None
@@ -1234,6 +1582,7 @@ def handle_touch():
             current_theme = CONFIG.get("theme", "dark")
             new_theme = "light" if current_theme == "dark" else "dark"
             CONFIG["theme"] = new_theme
+            init_settings()
 
             # OPTIMIZATION: Call init_themes() directly instead of recreating theme pens
             init_themes()
@@ -1246,6 +1595,53 @@ def handle_touch():
         _initial_touch_x = None
         _initial_touch_y = None
 
+# === MAIN LOOP TASKS ===
+TOUCH_POLL_ACTIVE_MS = 20
+TOUCH_POLL_IDLE_MS = 50
+
+def check_screen_sleep(now_sec):
+    """Enter screen sleep mode when in sleep hours without recent activity."""
+    if not _screen_sleep_state["active"] and should_enter_screen_sleep(now_sec):
+        enter_screen_sleep(now_sec)
+
+def update_memory_display(now_sec):
+    """Redraw the memory region (if enabled)."""
+    if _show_memory:
+        mark_region_dirty("memory")
+        update_region("memory", draw_memory_region)
+        presto.update()
+
+def run_periodic_refresh(now_sec):
+    """Reload events once the adaptive refresh interval has elapsed."""
+    global _events, _last_refresh
+    
+    refresh_interval = get_adaptive_refresh_interval(now_sec)
+    if (now_sec - _last_refresh) < refresh_interval:
+        return
+
+    _dbg("Periodic refresh starting, interval (s):", refresh_interval)
+    try:
+        new_events = load_events()
+        if new_events:
+            _events = new_events
+            for e in _events:
+                if not hasattr(e, "alert_fired"):
+                    e.alert_fired = False 
+            _dbg("Refresh successful, events:", len(_events))
+            update_network_status(True, now=now_sec)
+        else:
+            _dbg("Refresh returned no events, keeping existing")
+
+        _last_refresh = now_sec
+        # A refresh touches nearly every region and forces a full redraw anyway
+        mark_all_regions_dirty()
+        display_events_with_partial_updates(_events, _current_page, _last_refresh)
+        gc.collect()
+    except Exception as e:
+        print(f"Periodic refresh failed: {e}")
+        update_network_status(False, str(e), now_sec)
+        gc.collect()
+
 def main():
     """Main application loop."""
     global _events, _last_refresh
@@ -1272,27 +1668,26 @@ def main():
     display_events_with_partial_updates(_events, _current_page, _last_refresh)
     update_led_status(_events, _last_refresh)
 
-    loop_counter = 0
-    last_sleep_update = 0
-    last_memory_update = 0
+    # Periodic tasks as [callback(now_sec), next_due_ms, period_ms]
+    start_ms = utime.ticks_ms()
+    schedule = [
+        [run_periodic_refresh, start_ms, 1000],
+        [lambda now: update_indicators(_events, now), start_ms, 250],
+        [lambda now: check_alerts(_events, now), start_ms, 1000],
+        [update_memory_display, start_ms, 10000],
+        [check_screen_sleep, start_ms, 60000],
+    ]
 
     while True:
         try:
             now_sec = utime.time()
-            loop_counter += 1
-
-            # Screen sleep mode handling
-            if loop_counter % 240 == 0:
-                if should_enter_screen_sleep() and not _screen_sleep_state["active"]:
-                    enter_screen_sleep()
 
             # Handle screen sleep mode
             if _screen_sleep_state["active"]:
                 handle_touch()
 
-                if now_sec - last_sleep_update > 180:
-                    update_sleep_display()
-                    last_sleep_update = now_sec
+                if utime.ticks_diff(utime.ticks_ms(), _screen_sleep_state["next_update_ms"]) >= 0:
+                    update_sleep_display(now_sec)
 
                 if _last_touch is None:
                     utime.sleep_ms(1000)
@@ -1300,55 +1695,28 @@ def main():
                     utime.sleep_ms(50)
                 continue
 
-            # Memory updates (if enabled)
-            if CONFIG.get("SHOW_MEMORY", False) and (now_sec - last_memory_update) >= 10:
-                mark_region_dirty("memory")
-                update_region("memory", draw_memory_region)
-                presto.update()
-                last_memory_update = now_sec
-
-            # Periodic refresh
-            refresh_interval = get_adaptive_refresh_interval()
-
-            if (now_sec - _last_refresh) >= refresh_interval:
-                print(f"Periodic refresh starting (interval: {refresh_interval}s)...")
-                try:
-                    new_events = load_events()
-                    if new_events:
-                        _events = new_events
-                        for e in _events:
-                            if not hasattr(e, "alert_fired"):
-                                e.alert_fired = False 
-                        print(f"Refresh successful: {len(_events)} events")
-                        update_network_status(True)
-                    else:
-                        print("Refresh returned no events, keeping existing")
-
-                    _last_refresh = now_sec
-                    mark_region_dirty("events")
-                    mark_region_dirty("header")
-                    mark_region_dirty("refresh")
-                    mark_region_dirty("status")
-                    mark_region_dirty("pagination_left")
-                    mark_region_dirty("pagination_right")
-                    display_events_with_partial_updates(_events, _current_page, _last_refresh)
-                    gc.collect()
-                except Exception as e:
-                    print(f"Periodic refresh failed: {e}")
-                    update_network_status(False, str(e))
-                    gc.collect()
-
-            # Update LEDs
-            update_led_status(_events, now_sec)
-
-            # Update backlight
-            if loop_counter % 20 == 0:
-                update_backlight(_events, now_sec)
+            # Run every task whose deadline has passed
+            now_ms = utime.ticks_ms()
+            for task in schedule:
+                if utime.ticks_diff(now_ms, task[1]) >= 0:
+                    task[1] = utime.ticks_add(now_ms, task[2])
+                    task[0](now_sec)
 
+            # Touch has no interrupt, so it is always polled; faster during a gesture
             handle_touch()
-            check_alerts(_events, now_sec)
+            
+            # Draw page flips requested by touch, at most once per frame interval
+            if redraw_due():
+                display_events_with_partial_updates(_events, _current_page, _last_refresh)
 
-            utime.sleep_ms(20)
+            # Sleep until the next task is due or the next touch poll
+            sleep_ms = TOUCH_POLL_ACTIVE_MS if _last_touch is not None else TOUCH_POLL_IDLE_MS
+            now_ms = utime.ticks_ms()
+            for task in schedule:
+                due_in = utime.ticks_diff(task[1], now_ms)
+                if due_in < sleep_ms:
+                    sleep_ms = due_in
+            utime.sleep_ms(max(5, sleep_ms))
 
         except Exception as e:
             print(f"Main loop error: {e}")
@@ -1359,6 +1727,8 @@ def init_device():
     """Initialize hardware and load config."""
     global _last_activity
 
+    init_settings()
+    init_layout()
     init_themes()
     init_regions()
 
@@ -1369,7 +1739,7 @@ def init_device():
     vector.text("Loading...", 10, 50)
     presto.update()
 
-    vector.set_font_size(CONFIG.get("FONT_HEIGHT", 8))
+    set_font_size(CONFIG.get("FONT_HEIGHT", 8))
     _last_activity = utime.time()
 
     # Connect to WiFi
@@ -1397,13 +1767,19 @@ def init_device():
             "time.cloudflare.com"
         ]
 
+        # Short per-server timeout under one overall budget, so an unreachable
+        # pool cannot hold the boot screen for long
         time_synced = False
+        ntp_deadline = utime.ticks_add(utime.ticks_ms(), 4000)
         for server in ntp_servers:
+            if utime.ticks_diff(ntp_deadline, utime.ticks_ms()) <= 0:
+                print("NTP time budget exhausted")
+                break
             try:
                 print(f"Trying NTP server: {server}")
                 if hasattr(ntptime, 'host'):
                     ntptime.host = server
-                ntptime.timeout = 2
+                ntptime.timeout = 1
                 ntptime.settime()
                 print(f"Time synced successfully with {server}")
                 time_synced = True
@@ -1412,7 +1788,6 @@ def init_device():
             except Exception as server_error:
                 print(f"NTP server {server} failed: {server_error}")
                 update_network_status(False, f"NTP: {server_error}")
-                utime.sleep(2)
                 continue
             
         # Try worldtimeapi if NTP fails
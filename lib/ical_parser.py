@@ -29,6 +29,7 @@ Version: 1.0.1
 import urequests
 import gc
 import utime
+from array import array
 from timezone_lib import (
     load_timezone_data,
     convert_to_utc,
@@ -44,6 +45,7 @@ DEFAULT_MAX_OCCURRENCES_PER_EVENT = 50
 DEFAULT_CACHE_VALIDITY_SECONDS = 300  # 5 minutes
 DEFAULT_MAX_DESCRIPTION_LENGTH = 200
 DEFAULT_MAX_RDATE_COUNT = 20
+DEFAULT_MAX_CACHED_CALENDARS = 4
 
 # Configuration globals (can be modified via set_limits())
 MAX_RECURRENCE_ITERATIONS = DEFAULT_MAX_RECURRENCE_ITERATIONS
@@ -52,18 +54,50 @@ CACHE_VALIDITY_SECONDS = DEFAULT_CACHE_VALIDITY_SECONDS
 MAX_DESCRIPTION_LENGTH = DEFAULT_MAX_DESCRIPTION_LENGTH
 MAX_RDATE_COUNT = DEFAULT_MAX_RDATE_COUNT
 HTTP_TIMEOUT = DEFAULT_HTTP_TIMEOUT
+MAX_CACHED_CALENDARS = DEFAULT_MAX_CACHED_CALENDARS
 
 # === CONSTANTS ===
 _DAY_MAP = {'MO': 0, 'TU': 1, 'WE': 2, 'TH': 3, 'FR': 4, 'SA': 5, 'SU': 6}
+# _DAY_MAP keyed by the two character codes packed into one int, so BYDAY
+# parsing needs no string allocation; masking with _DAY_CASE_MASK folds
+# lowercase letters to uppercase
+_DAY_PAIRS = {(ord(k[0]) << 8) | ord(k[1]): v for k, v in _DAY_MAP.items()}
+_DAY_CASE_MASK = 0xDFDF
 _SECONDS_PER_DAY = 86400
 _SECONDS_PER_WEEK = 604800
+_MONTH_LEN = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Approximate interval lengths for when calendar arithmetic fails
+_FALLBACK_INTERVALS = {
+    "DAILY": _SECONDS_PER_DAY,
+    "WEEKLY": _SECONDS_PER_WEEK,
+    "MONTHLY": _SECONDS_PER_DAY * 30,
+    "YEARLY": _SECONDS_PER_DAY * 365
+}
+
+_EMPTY_SET = set()  # Shared, never modified
+
+# Byte values used by the VEVENT scanner
+_NEWLINE_BYTES = (10, 13)
+_FOLD_BYTES = (32, 9)
+# Leading bytes of the properties process_ics_line handles (D, E, R, S)
+_PROPERTY_LEAD_BYTES = (68, 69, 82, 83)
+
+# Read size used when streaming a calendar body
+_STREAM_CHUNK_SIZE = 1024
 
 # === GLOBAL STATE ===
 load_timezone_data()
 _parsing_cache = {}
+_canonical_urls = {}  # Input URL -> shared canonical URL string
+_CANONICAL_URL_CACHE_SIZE = 8
+_dt_cache = {}
+_DT_CACHE_SIZE = 256
+_local_cache = [None, None, None]  # (timestamp, tzid, local time tuple)
 _in_event_state = False
 _current_raw_event_state = None
 _raw_events_data_list = []
+_overrides_map = {}  # tzid -> {recurrence start: raw override event}
 
 # === EVENT DATA STRUCTURE ===
 class Event:
@@ -88,6 +122,17 @@ class Event:
         self.description = description if description is not None else ""
         self.tzid = tzid if tzid is not None else "UTC"
 
+    @staticmethod
+    def _new(dtstart, dtend, summary, description, tzid):
+        """Build an Event from values already known to be non-None."""
+        event = Event.__new__(Event)
+        event.dtstart = dtstart
+        event.dtend = dtend
+        event.summary = summary
+        event.description = description
+        event.tzid = tzid
+        return event
+
     def __lt__(self, other):
         if not isinstance(other, Event):
             return NotImplemented
@@ -106,6 +151,10 @@ class Event:
         return hash((self.dtstart, self.dtend, self.summary, self.description, self.tzid))
     
     def __repr__(self):
+        return f"Event({self.dtstart}..{self.dtend} {self.summary!r})"
+
+    def describe(self):
+        """Return a human-readable dump with the start/end times formatted."""
         start_local = utime.localtime(self.dtstart)
         end_local = utime.localtime(self.dtend)
         
@@ -117,6 +166,10 @@ class Event:
                 f"description='{self.description[:50]}...', "
                 f"tzid='{self.tzid}')")
 
+def _dtstart_key(event):
+    """Sort key for events; one attribute read per event instead of __lt__ calls."""
+    return event.dtstart
+
 # === DATETIME PARSING ===
 def parse_datetime(line):
     """
@@ -142,8 +195,34 @@ def parse_datetime(line):
             tzid = normalize_timezone_id(line[tz_start:tz_end])
     
     colon_pos = line.rfind(':')
-    dt_val = line[colon_pos + 1:].strip()
+    return parse_datetime_value(line[colon_pos + 1:].strip(), tzid)
+
+def parse_datetime_value(dt_val, tzid):
+    """
+    Convert a DATE or DATE-TIME value in the given timezone to a Unix timestamp.
     
+    Results are memoized on (tzid, dt_val), since EXDATE/RDATE lists and
+    repeated fetches parse the same values over and over.
+    
+    Args:
+        dt_val: Value part of the property (e.g., "20231201T120000")
+        tzid: Normalized timezone identifier
+        
+    Returns:
+        Unix timestamp or None if parsing fails
+    """
+    key = (tzid, dt_val)
+    if key in _dt_cache:
+        return _dt_cache[key]
+    if len(_dt_cache) >= _DT_CACHE_SIZE:
+        _dt_cache.clear()
+    
+    ts = _parse_datetime_value(dt_val, tzid)
+    _dt_cache[key] = ts
+    return ts
+
+def _parse_datetime_value(dt_val, tzid):
+    """Uncached body of parse_datetime_value()."""
     # Handle UTC indicator and timezone offsets
     is_zulu = dt_val.endswith('Z')
     if is_zulu or dt_val.find('+') != -1 or dt_val.find('-') != -1:
@@ -186,6 +265,99 @@ def parse_datetime(line):
     
     return convert_to_utc(tpl, tzid)
 
+def _parse_ics_dt_bytes(buf, off, end):
+    """
+    Read a plain DATE or DATE-TIME value straight from bytes.
+    
+    Handles the common shapes YYYYMMDD, YYYYMMDDTHHMMSS and YYYYMMDDTHHMMSSZ
+    with digit arithmetic on the byte values, avoiding decode and int() calls.
+    
+    Args:
+        buf: Line bytes
+        off: Offset of the first character of the value
+        end: Offset just past the last character of the value
+        
+    Returns:
+        Tuple (year, month, day, hour, minute, second, is_zulu), or None for
+        any other shape so the caller can fall back to parse_datetime()
+    """
+    length = end - off
+    if length == 8:
+        last = off + 8
+    elif length == 15 or (length == 16 and buf[end - 1] == 90):  # 'Z'
+        if buf[off + 8] != 84:  # 'T'
+            return None
+        last = off + 15
+    else:
+        return None
+    
+    for i in range(off, last):
+        if i != off + 8 and not 48 <= buf[i] <= 57:
+            return None
+    
+    year = (buf[off] - 48) * 1000 + (buf[off + 1] - 48) * 100 + (buf[off + 2] - 48) * 10 + buf[off + 3] - 48
+    month = (buf[off + 4] - 48) * 10 + buf[off + 5] - 48
+    day = (buf[off + 6] - 48) * 10 + buf[off + 7] - 48
+    if length == 8:
+        return (year, month, day, 0, 0, 0, False)
+    
+    hour = (buf[off + 9] - 48) * 10 + buf[off + 10] - 48
+    minute = (buf[off + 11] - 48) * 10 + buf[off + 12] - 48
+    second = (buf[off + 13] - 48) * 10 + buf[off + 14] - 48
+    return (year, month, day, hour, minute, second, length == 16)
+
+def parse_datetime_bytes(line_bytes):
+    """
+    Parse a DTSTART/DTEND style property line given as bytes.
+    
+    Only the TZID parameter is decoded; the value itself is read with
+    parse_datetime_at().
+    
+    Args:
+        line_bytes: iCalendar property line as bytes
+        
+    Returns:
+        Tuple (timestamp or None, normalized tzid or None without a TZID parameter)
+    """
+    colon_pos = line_bytes.rfind(b':')
+    if colon_pos == -1:
+        return None, None
+    
+    tzid = None
+    tzid_pos = line_bytes.find(b'TZID=', 0, colon_pos)
+    if tzid_pos != -1:
+        tz_start = tzid_pos + 5
+        tz_end = line_bytes.find(b':', tz_start)
+        tzid = normalize_timezone_id(line_bytes[tz_start:tz_end].decode('utf-8'))
+    
+    return parse_datetime_at(line_bytes, colon_pos + 1, tzid), tzid
+
+def parse_datetime_at(buf, value_pos, tzid):
+    """
+    Parse the DATE or DATE-TIME value that runs from value_pos to the end of buf.
+    
+    Callers pass the value offset and timezone they already located, so
+    the line is not scanned again. Unusual values fall back to
+    parse_datetime_value().
+    
+    Args:
+        buf: Line bytes
+        value_pos: Offset of the first character of the value
+        tzid: Normalized timezone identifier, or None for UTC
+        
+    Returns:
+        Unix timestamp or None if parsing fails
+    """
+    fields = _parse_ics_dt_bytes(buf, value_pos, len(buf))
+    if fields is None:
+        return parse_datetime_value(buf[value_pos:].decode('utf-8').strip(), tzid or "UTC")
+    
+    tpl = fields[:6]
+    if fields[6] or tzid is None or tzid == "UTC":
+        return utime.mktime(tpl + (0, 0))
+    
+    return convert_to_utc(tpl, tzid)
+
 def parse_rrule(rrule_str):
     """
     Parse RRULE string into dictionary.
@@ -215,15 +387,21 @@ def parse_date_list(line, current, field_name):
     colon_pos = line.find(':')
     if colon_pos == -1:
         return
+    
+    # The property's own TZID wins over the event timezone
+    tzid = current.get('tzid', 'UTC')
+    tzid_pos = line.find("TZID=", 0, colon_pos)
+    if tzid_pos != -1:
+        tz_start = tzid_pos + 5
+        tz_end = line.find(";", tz_start, colon_pos)
+        tzid = normalize_timezone_id(line[tz_start:tz_end if tz_end != -1 else colon_pos])
         
     date_str = line[colon_pos + 1:]
-    tzid = current.get('tzid', 'UTC')
     
     for date_part in date_str.split(','):
         date_part = date_part.strip()
         if date_part:
-            dt_line = f"{line[:colon_pos]};TZID={tzid}:{date_part}"
-            ts = parse_datetime(dt_line)
+            ts = parse_datetime_value(date_part, tzid)
             if ts is not None:
                 current[field_name].append(ts)
 
@@ -232,17 +410,32 @@ def clean_description(raw):
     """
     Clean and truncate event description text.
     
+    Only the part of the value that can survive truncation is unescaped
+    and decoded.
+    
     Args:
-        raw: Raw description text from iCalendar
+        raw: Raw description value from iCalendar as bytes
         
     Returns:
         Cleaned and truncated description string
     """
+    raw = raw.strip()
     if not raw:
         return ""
-        
+    
+    # A character takes at most 4 bytes, so this keeps enough to truncate
+    limit = 4 * MAX_DESCRIPTION_LENGTH + 8
+    if len(raw) > limit:
+        raw = raw[:limit]
+        # Drop any UTF-8 sequence cut in half by the slice
+        while raw and raw[-1] & 0xC0 == 0x80:
+            raw = raw[:-1]
+        if raw and raw[-1] >= 0xC0:
+            raw = raw[:-1]
+    
     # Unescape common iCalendar escape sequences
-    text = raw.replace("\\n", "\n").replace("\\,", ",").replace("\\;", ";")
+    raw = raw.replace(b"\\n", b"\n").replace(b"\\,", b",").replace(b"\\;", b";")
+    text = raw.decode('utf-8')
     
     # Truncate if too long
     if len(text) > MAX_DESCRIPTION_LENGTH:
@@ -251,6 +444,21 @@ def clean_description(raw):
     return text.strip()
 
 # === RECURRENCE UTILITIES ===
+def convert_to_local_cached(timestamp, tzid):
+    """
+    convert_to_local() with a one-entry cache.
+    
+    The recurrence search checks a candidate's rules and then advances
+    from the same candidate, so the second conversion is served from here.
+    """
+    if _local_cache[0] == timestamp and _local_cache[1] == tzid:
+        return _local_cache[2]
+    local_time = convert_to_local(timestamp, tzid)
+    _local_cache[0] = timestamp
+    _local_cache[1] = tzid
+    _local_cache[2] = local_time
+    return local_time
+
 def matches_recurrence_rules(timestamp, tzid, byday=None, bymonth=None, bymonthday=None):
     """
     Check if timestamp matches RRULE constraints (BYDAY, BYMONTH, BYMONTHDAY).
@@ -258,9 +466,9 @@ def matches_recurrence_rules(timestamp, tzid, byday=None, bymonth=None, bymonthd
     Args:
         timestamp: Unix timestamp to check
         tzid: Timezone for conversion
-        byday: List of weekdays (0=Monday, 6=Sunday)
-        bymonth: List of months (1-12)
-        bymonthday: List of days of month (1-31)
+        byday: Set (or list) of weekdays (0=Monday, 6=Sunday)
+        bymonth: Set (or list) of months (1-12)
+        bymonthday: Set (or list) of days of month (1-31)
         
     Returns:
         True if timestamp matches all specified constraints
@@ -269,23 +477,49 @@ def matches_recurrence_rules(timestamp, tzid, byday=None, bymonth=None, bymonthd
         return True  # No constraints to check
     
     try:
-        local_time = convert_to_local(timestamp, tzid)
-        year, month, day, hour, minute, second, weekday, yearday = local_time
-        
-        # Check constraints in order of most restrictive first
-        if bymonthday and day not in bymonthday:
-            return False
-            
-        if bymonth and month not in bymonth:
-            return False
-            
-        if byday and weekday not in byday:
-            return False
-                
-        return True
+        return _matches_local_date(convert_to_local_cached(timestamp, tzid),
+                                   byday, bymonth, bymonthday)
     except:
         return False
 
+def _matches_local_date(local_time, byday, bymonth, bymonthday):
+    """Check BY* constraints against a normalized local time tuple."""
+    # Check constraints in order of most restrictive first
+    if bymonthday and local_time[2] not in bymonthday:
+        return False
+        
+    if bymonth and local_time[1] not in bymonth:
+        return False
+        
+    if byday and local_time[6] not in byday:
+        return False
+            
+    return True
+
+def _match_byday(local_time, byday, bymonth, bymonthday):
+    """BYDAY-only variant of _matches_local_date()."""
+    return local_time[6] in byday
+
+def _match_bymonthday(local_time, byday, bymonth, bymonthday):
+    """BYMONTHDAY-only variant of _matches_local_date()."""
+    return local_time[2] in bymonthday
+
+def select_rule_matcher(byday, bymonth, bymonthday):
+    """
+    Pick the cheapest local-date check for a rule's BY* constraints.
+    
+    Returns:
+        Function taking (local_time, byday, bymonth, bymonthday), or None
+        when the rule has no BY* constraints
+    """
+    if bymonth or (byday and bymonthday):
+        return _matches_local_date
+    if byday:
+        return _match_byday
+    if bymonthday:
+        return _match_bymonthday
+    return None
+
 def calculate_skip_count(base_ts, search_start_ts, freq, interval):
     """
     Calculate how many recurrence intervals to skip to approach search_start_ts.
@@ -321,6 +555,50 @@ def calculate_skip_count(base_ts, search_start_ts, freq, interval):
     # Skip to within a few intervals of the target
     return max(0, int(time_diff / interval_seconds) - 2)
 
+def _days_in_month(year, month):
+    """Number of days in a month, accounting for leap years."""
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _MONTH_LEN[month]
+
+def _advance_daily(local_time, interval):
+    return (local_time[0], local_time[1], local_time[2] + interval,
+            local_time[3], local_time[4], local_time[5])
+
+def _advance_weekly(local_time, interval):
+    return (local_time[0], local_time[1], local_time[2] + (7 * interval),
+            local_time[3], local_time[4], local_time[5])
+
+def _advance_monthly(local_time, interval):
+    new_month = local_time[1] + interval
+    new_year = local_time[0] + (new_month - 1) // 12
+    new_month = (new_month - 1) % 12 + 1
+    
+    # Clamp to the last day of the target month
+    max_day = _days_in_month(new_year, new_month)
+    new_day = local_time[2] if local_time[2] <= max_day else max_day
+        
+    return (new_year, new_month, new_day,
+            local_time[3], local_time[4], local_time[5])
+
+def _advance_yearly(local_time, interval):
+    new_year = local_time[0] + interval
+    new_day = local_time[2]
+    # Handle Feb 29 in non-leap years
+    if local_time[1] == 2 and local_time[2] == 29 and new_year % 4 != 0:
+        new_day = 28
+        
+    return (new_year, local_time[1], new_day,
+            local_time[3], local_time[4], local_time[5])
+
+# Local-time step for each supported RRULE frequency
+_ADVANCE = {
+    "DAILY": _advance_daily,
+    "WEEKLY": _advance_weekly,
+    "MONTHLY": _advance_monthly,
+    "YEARLY": _advance_yearly,
+}
+
 def advance_recurrence(current_ts, freq, interval, tzid):
     """
     Advance a timestamp by one recurrence interval.
@@ -337,78 +615,115 @@ def advance_recurrence(current_ts, freq, interval, tzid):
     Returns:
         Next occurrence timestamp
     """
+    advance = _ADVANCE.get(freq)
+    if advance is None:
+        return current_ts + _SECONDS_PER_DAY * interval
+    
     try:
-        local_time = convert_to_local(current_ts, tzid)
-        
-        if freq == "DAILY":
-            new_local = (local_time[0], local_time[1], local_time[2] + interval,
-                       local_time[3], local_time[4], local_time[5])
-        elif freq == "WEEKLY":
-            new_local = (local_time[0], local_time[1], local_time[2] + (7 * interval),
-                       local_time[3], local_time[4], local_time[5])
-        elif freq == "MONTHLY":
-            new_month = local_time[1] + interval
-            new_year = local_time[0] + (new_month - 1) // 12
-            new_month = (new_month - 1) % 12 + 1
-            
-            # Handle month boundaries (simplified approach)
-            new_day = local_time[2]
-            if new_month == 2 and new_day > 28:
-                new_day = 28
-            elif new_month in (4, 6, 9, 11) and new_day > 30:
-                new_day = 30
-                
-            new_local = (new_year, new_month, new_day,
-                       local_time[3], local_time[4], local_time[5])
-        elif freq == "YEARLY":
-            new_year = local_time[0] + interval
-            new_day = local_time[2]
-            # Handle Feb 29 in non-leap years
-            if local_time[1] == 2 and local_time[2] == 29 and new_year % 4 != 0:
-                new_day = 28
-                
-            new_local = (new_year, local_time[1], new_day,
-                       local_time[3], local_time[4], local_time[5])
-        else:
-            return current_ts + _SECONDS_PER_DAY * interval
+        return convert_to_utc(advance(convert_to_local_cached(current_ts, tzid), interval), tzid)
+    except:
+        # Fallback to simple arithmetic
+        return current_ts + _FALLBACK_INTERVALS.get(freq, _SECONDS_PER_DAY) * interval
+
+def _skip_local(local_time, freq, interval, steps):
+    """
+    Advance a local time tuple by several recurrence intervals at once.
+    
+    Applies the same calendar arithmetic as the _advance_* helpers,
+    including month-end clamping, without stepping one interval at a time.
+    
+    Returns:
+        New (year, month, day, hour, minute, second) tuple, or None for an
+        unsupported frequency
+    """
+    year, month, day = local_time[0], local_time[1], local_time[2]
+    
+    if freq == "DAILY":
+        day += steps * interval
+    elif freq == "WEEKLY":
+        day += 7 * steps * interval
+    elif freq == "MONTHLY":
+        # A clamped day sticks for later steps; no month is shorter than 28
+        # days, so the visited months only matter until the day gets there
+        i = 1
+        while day > 28 and i <= steps:
+            visited = month - 1 + i * interval
+            max_day = _days_in_month(year + visited // 12, visited % 12 + 1)
+            if day > max_day:
+                day = max_day
+            i += 1
+        months = month - 1 + steps * interval
+        year += months // 12
+        month = months % 12 + 1
+    elif freq == "YEARLY":
+        # Feb 29 becomes Feb 28 at the first non-leap year visited
+        if month == 2 and day == 29:
+            for i in range(1, min(steps, 4) + 1):
+                if (year + i * interval) % 4 != 0:
+                    day = 28
+                    break
+        year += steps * interval
+    else:
+        return None
+    
+    return (year, month, day, local_time[3], local_time[4], local_time[5])
+
+def skip_recurrences(current_ts, freq, interval, tzid, steps):
+    """
+    Advance a timestamp by several recurrence intervals in one jump.
+    
+    Works in local time with a single pair of timezone conversions, so the
+    event's wall-clock time is kept across DST changes.
+    
+    Args:
+        current_ts: Current timestamp
+        freq: Frequency (DAILY, WEEKLY, MONTHLY, YEARLY)
+        interval: Interval multiplier
+        tzid: Timezone for calculations
+        steps: Number of intervals to advance
         
+    Returns:
+        Timestamp of the occurrence steps intervals later
+    """
+    if steps <= 0:
+        return current_ts
+    
+    try:
+        new_local = _skip_local(convert_to_local(current_ts, tzid), freq, interval, steps)
+        if new_local is None:
+            return current_ts + _SECONDS_PER_DAY * interval * steps
         return convert_to_utc(new_local, tzid)
         
     except:
         # Fallback to simple arithmetic
-        fallback_intervals = {
-            "DAILY": _SECONDS_PER_DAY,
-            "WEEKLY": _SECONDS_PER_WEEK,
-            "MONTHLY": _SECONDS_PER_DAY * 30,
-            "YEARLY": _SECONDS_PER_DAY * 365
-        }
-        return current_ts + fallback_intervals.get(freq, _SECONDS_PER_DAY) * interval
+        return current_ts + _FALLBACK_INTERVALS.get(freq, _SECONDS_PER_DAY) * interval * steps
 
-def find_next_occurrence(search_start_ts, event_data, duration_sec, now_ts, tzid, exdates=None, end_filter_ts=None):
+def iter_occurrences(event_data, search_start_ts, tzid, exdates=None, end_filter_ts=None):
     """
-    Find the next occurrence of a recurring event after search_start_ts.
+    Yield successive occurrences of a recurring event from search_start_ts on.
+    
+    The rule is read and the initial skip applied once; after that each
+    occurrence only costs the steps from the previous one.
     
     Args:
-        search_start_ts: Start searching from this timestamp
         event_data: Event data dictionary with RRULE information
-        duration_sec: Event duration in seconds
-        now_ts: Current timestamp
+        search_start_ts: Start searching from this timestamp
         tzid: Event timezone
-        exdates: List of excluded dates
+        exdates: List of excluded dates, used if event_data has no '_exdates_set'
         end_filter_ts: Stop searching after this timestamp
         
-    Returns:
-        Next occurrence timestamp or None if no more occurrences
+    Yields:
+        Occurrence start timestamps in increasing order
     """
     if event_data is None or '_parsed_rrule' not in event_data:
-        return None
+        return
 
     original_base_dtstart = event_data['dtstart']
     rule = event_data['_parsed_rrule']
     
     freq = rule.get("FREQ")
     if not freq:
-        return None
+        return
         
     interval = int(rule.get("INTERVAL", "1"))
     byday_processed = rule.get("_byday_processed", [])
@@ -423,21 +738,41 @@ def find_next_occurrence(search_start_ts, event_data, duration_sec, now_ts, tzid
         effective_until_ts = min(until_ts, end_filter_ts) if until_ts else end_filter_ts
 
     if effective_until_ts and original_base_dtstart > effective_until_ts:
-        return None
+        return
 
-    ex_set = set(exdates or []) if exdates else set()
+    ex_set = event_data.get('_exdates_set')
+    if ex_set is None:
+        ex_set = set(exdates) if exdates else _EMPTY_SET
     
     # Use skip calculation to avoid iterating through many occurrences
     candidate_ts = original_base_dtstart
     skip_count = calculate_skip_count(original_base_dtstart, search_start_ts, freq, interval)
     
-    # Apply calculated skip
-    for _ in range(skip_count):
-        candidate_ts = advance_recurrence(candidate_ts, freq, interval, tzid)
-        if candidate_ts is None:
-            return None
-    
-    # Search for valid occurrence
+    # Walk the series in local wall-clock time, so DST changes cannot make
+    # later occurrences drift; the skip is applied in a single jump
+    advance = _ADVANCE.get(freq)
+    local_time = None
+    if advance is not None:
+        local_time = convert_to_local(original_base_dtstart, tzid)
+        if skip_count:
+            local_time = _skip_local(local_time, freq, interval, skip_count)
+            candidate_ts = convert_to_utc(local_time, tzid)
+    
+    # DAILY/WEEKLY steps only move the date, so BY* filters can be checked
+    # on the normalized local date and rejected candidates never need a
+    # UTC conversion
+    if '_match_fn' in rule:
+        match_local = rule['_match_fn']
+    else:
+        match_local = select_rule_matcher(byday_processed, bymonth_processed, bymonthday_processed)
+    check_local = (freq == "DAILY" or freq == "WEEKLY") and match_local is not None
+    local_ok = False
+    if check_local:
+        local_time = utime.localtime(utime.mktime(local_time[:6] + (0, 0)))
+        local_ok = match_local(
+            local_time, byday_processed, bymonth_processed, bymonthday_processed)
+    
+    # Search for valid occurrences; the iteration budget applies per occurrence
     iterations = 0
     count = skip_count  # Track total count including skipped
     
@@ -446,98 +781,169 @@ def find_next_occurrence(search_start_ts, event_data, duration_sec, now_ts, tzid
         
         # Check termination conditions
         if effective_until_ts and candidate_ts > effective_until_ts:
-            return None
+            return
             
         if count_limit and count >= count_limit:
-            return None
-
-        # Check RRULE constraints
-        is_valid = matches_recurrence_rules(
-            candidate_ts, tzid, byday_processed, bymonth_processed, bymonthday_processed
-        )
-
-        # Check if this occurrence is excluded
-        is_excluded = candidate_ts in ex_set
+            return
 
-        if is_valid and not is_excluded and candidate_ts >= search_start_ts:
-            return candidate_ts
+        # Cheapest tests first; the RRULE constraint check may need a
+        # timezone conversion
+        if (candidate_ts >= search_start_ts and candidate_ts not in ex_set and
+                (local_ok if check_local else
+                 match_local is None or match_local(
+                     convert_to_local_cached(candidate_ts, tzid),
+                     byday_processed, bymonth_processed, bymonthday_processed))):
+            yield candidate_ts
+            iterations = 0
 
         # Advance to next occurrence
-        candidate_ts = advance_recurrence(candidate_ts, freq, interval, tzid)
-        if candidate_ts is None:
-            return None
+        if advance is None:
+            candidate_ts += _SECONDS_PER_DAY * interval
+        elif check_local:
+            local_time = advance(local_time, interval)
+            local_time = utime.localtime(utime.mktime(local_time[:6] + (0, 0)))
+            local_ok = match_local(
+                local_time, byday_processed, bymonth_processed, bymonthday_processed)
+            if local_ok:
+                candidate_ts = convert_to_utc(local_time, tzid)
+        else:
+            local_time = advance(local_time, interval)
+            candidate_ts = convert_to_utc(local_time, tzid)
             
         count += 1
-            
+
+def find_next_occurrence(search_start_ts, event_data, duration_sec, now_ts, tzid, exdates=None, end_filter_ts=None):
+    """
+    Find the next occurrence of a recurring event after search_start_ts.
+    
+    Args:
+        search_start_ts: Start searching from this timestamp
+        event_data: Event data dictionary with RRULE information
+        duration_sec: Event duration in seconds
+        now_ts: Current timestamp
+        tzid: Event timezone
+        exdates: List of excluded dates
+        end_filter_ts: Stop searching after this timestamp
+        
+    Returns:
+        Next occurrence timestamp or None if no more occurrences
+    """
+    for occurrence_ts in iter_occurrences(event_data, search_start_ts, tzid, exdates, end_filter_ts):
+        return occurrence_ts
     return None
 
 # === EVENT PROCESSING ===
-def process_event_occurrences(event_data, start_filter_ts, end_filter_ts, now_ts):
+def process_event_occurrences_soa(event_data, start_filter_ts, end_filter_ts):
     """
-    Generate all occurrences of an event within the specified time range.
+    Generate the occurrence times of an event as parallel arrays.
     
-    Handles both single events and recurring events with their exceptions.
+    Only dtstart/dtend vary between occurrences of a series, so they are
+    packed into arrays while the summary, description and tzid are shared
+    by every occurrence.
     
     Args:
         event_data: Raw event data dictionary
         start_filter_ts: Filter events starting after this timestamp
-        end_filter_ts: Filter events starting before this timestamp  
-        now_ts: Current timestamp
+        end_filter_ts: Filter events starting before this timestamp
         
-    Yields:
-        Event objects for each occurrence
+    Returns:
+        Tuple of (dtstart_array, dtend_array, summary, description, tzid),
+        or None for recurrence exception events
     """
+    # Skip recurrence exception events (they override specific occurrences)
+    if 'recurrence_id' in event_data:
+        return None
+
     base_dtstart = event_data['dtstart']
     base_dtend = event_data['dtend']
-    summary = event_data.get('summary', '')
-    description = event_data.get('description', '')
-    tzid = event_data.get('tzid', 'UTC')
-
     duration = base_dtend - base_dtstart
+    tzid = event_data.get('tzid', 'UTC')
+    rdates = event_data.get('rdates', [])
 
-    is_recurring_series = '_parsed_rrule' in event_data and event_data.get('_parsed_rrule') is not None
-    has_rdate_exceptions = len(event_data.get('rdates', [])) > 0
-    is_override = 'recurrence_id' in event_data
-
-    # Skip recurrence exception events (they override specific occurrences)
-    if is_override:
-        return
+    dtstarts = array('q')
+    dtends = array('q')
+    batch = (dtstarts, dtends, event_data.get('summary', ''),
+             event_data.get('description', ''), tzid)
 
     # Handle single (non-recurring) events
-    if not is_recurring_series and not has_rdate_exceptions:
-        if base_dtend >= start_filter_ts and base_dtstart <= end_filter_ts:
-            yield Event(base_dtstart, base_dtend, summary, description, tzid)
-        return
-
-    # Handle recurring events
-    if is_recurring_series:
-        current_search_point = start_filter_ts
+    if event_data.get('_parsed_rrule') is None:
+        if not rdates:
+            if base_dtend >= start_filter_ts and base_dtstart <= end_filter_ts:
+                dtstarts.append(base_dtstart)
+                dtends.append(base_dtend)
+            return batch
+    else:
+        # Handle recurring events
         occurrences_found = 0
-
-        while occurrences_found < MAX_OCCURRENCES_PER_EVENT:
-            next_occurrence_ts = find_next_occurrence(
-                search_start_ts=current_search_point,
-                event_data=event_data,
-                duration_sec=duration,
-                now_ts=now_ts,
-                tzid=tzid,
-                exdates=event_data.get('exdates', []),
-                end_filter_ts=end_filter_ts
-            )
-
-            if next_occurrence_ts is None or next_occurrence_ts > end_filter_ts:
+        for next_occurrence_ts in iter_occurrences(event_data, start_filter_ts, tzid,
+                                                   event_data.get('exdates', []), end_filter_ts):
+            if next_occurrence_ts > end_filter_ts or occurrences_found >= MAX_OCCURRENCES_PER_EVENT:
                 break
 
-            yield Event(next_occurrence_ts, next_occurrence_ts + duration, summary, description, tzid)
+            dtstarts.append(next_occurrence_ts)
+            dtends.append(next_occurrence_ts + duration)
             occurrences_found += 1
-            current_search_point = next_occurrence_ts + 1
 
     # Handle additional dates (RDATE)
-    for i, r_ts in enumerate(event_data.get('rdates', [])):
+    for i, r_ts in enumerate(rdates):
         if i >= MAX_RDATE_COUNT:
             break
         if (r_ts + duration >= start_filter_ts) and (r_ts <= end_filter_ts):
-            yield Event(r_ts, r_ts + duration, summary, description, tzid)
+            dtstarts.append(r_ts)
+            dtends.append(r_ts + duration)
+
+    return batch
+
+def process_event_occurrences(event_data, start_filter_ts, end_filter_ts, now_ts):
+    """
+    Generate all occurrences of an event within the specified time range.
+    
+    Handles both single events and recurring events with their exceptions.
+    
+    Args:
+        event_data: Raw event data dictionary
+        start_filter_ts: Filter events starting after this timestamp
+        end_filter_ts: Filter events starting before this timestamp  
+        now_ts: Current timestamp
+        
+    Yields:
+        Event objects for each occurrence
+    """
+    batch = process_event_occurrences_soa(event_data, start_filter_ts, end_filter_ts)
+    if batch is None:
+        return
+
+    dtstarts, dtends, summary, description, tzid = batch
+    for i in range(len(dtstarts)):
+        yield Event._new(dtstarts[i], dtends[i], summary, description, tzid)
+
+def events_in_window(events_list, start_filter_ts, end_filter_ts):
+    """
+    Select the events of a dtstart-sorted list that overlap a time window.
+    
+    A binary search finds the first event starting after the window, so
+    only the events before it are examined and no re-sort is needed. End
+    times are not ordered, so those events are still checked one by one;
+    cached lists only hold events that ended after their parse time, which
+    keeps that prefix short.
+    
+    Args:
+        events_list: Events sorted by dtstart
+        start_filter_ts: Keep events ending at or after this timestamp
+        end_filter_ts: Keep events starting at or before this timestamp
+        
+    Returns:
+        List of matching events, sorted by dtstart
+    """
+    lo, hi = 0, len(events_list)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if events_list[mid].dtstart <= end_filter_ts:
+            lo = mid + 1
+        else:
+            hi = mid
+    
+    return [events_list[i] for i in range(lo) if events_list[i].dtend >= start_filter_ts]
 
 # === HTTP UTILITIES ===
 def canonicalize_url(url):
@@ -550,32 +956,28 @@ def canonicalize_url(url):
     Returns:
         Normalized HTTPS URL
     """
+    # The same URL is canonicalized on every refresh; returning one shared
+    # string also lets cache lookups match by identity
+    cached = _canonical_urls.get(url)
+    if cached is not None:
+        return cached
+    if len(_canonical_urls) >= _CANONICAL_URL_CACHE_SIZE:
+        _canonical_urls.clear()
+    
     if url.startswith("webcal://"):
-        return url.replace("webcal://", "https://", 1)
+        canonical = url.replace("webcal://", "https://", 1)
     elif url.startswith("ical://"):
-        return url.replace("ical://", "https://", 1)
+        canonical = url.replace("ical://", "https://", 1)
     elif not (url.startswith("http://") or url.startswith("https://")):
-        return "https://" + url
-    return url
-
-def calculate_content_hash(content_bytes):
-    """
-    Calculate hash of content for change detection when HTTP headers unavailable.
+        canonical = "https://" + url
+    else:
+        canonical = url
     
-    Args:
-        content_bytes: Raw content bytes
-        
-    Returns:
-        Content hash string
-    """
-    try:
-        import uhashlib
-        hasher = uhashlib.sha256()
-        hasher.update(content_bytes)
-        return hasher.hexdigest()[:16]  # Compact hash
-    except:
-        # Fallback checksum
-        return str(sum(content_bytes) % 999999)
+    # Map both spellings to the same object, so re-canonicalizing is a hit
+    canonical = _canonical_urls.get(canonical, canonical)
+    _canonical_urls[url] = canonical
+    _canonical_urls[canonical] = canonical
+    return canonical
 
 def http_head_request(url, timeout=None):
     """
@@ -628,17 +1030,59 @@ def http_head_request(url, timeout=None):
         if response:
             response.close()
 
-def http_fetch_content(url, cached_entry=None, timeout=None):
+def iter_stream_lines(stream, counter):
+    """
+    Read a response body in chunks and split it into physical lines.
+    
+    The length of every chunk is added to counter[0], so the body is
+    measured without ever being held in full.
+    
+    Args:
+        stream: Readable body stream (response.raw)
+        counter: One-element list accumulating the body length
+        
+    Yields:
+        Lines as bytes with CR/LF line endings removed
+    """
+    pending = b""
+    while True:
+        chunk = stream.read(_STREAM_CHUNK_SIZE)
+        if not chunk:
+            break
+        counter[0] += len(chunk)
+        
+        # Walk the lines with find() rather than split(), so no list of
+        # lines is built per chunk
+        buf = pending + chunk if pending else chunk
+        start = 0
+        nl = buf.find(b"\n")
+        while nl != -1:
+            end = nl - 1 if nl > start and buf[nl - 1] == 13 else nl
+            yield buf[start:end]
+            start = nl + 1
+            nl = buf.find(b"\n", start)
+        pending = buf[start:]
+    
+    if pending:
+        yield pending[:-1] if pending[-1] == 13 else pending
+
+def http_fetch_content(url, cached_entry=None, timeout=None, line_handler=None):
     """
     Fetch calendar content via HTTP GET request.
     
+    With a line_handler the body is streamed: each unfolded line is passed
+    to line_handler as it arrives and the body itself is never returned.
+    
     Args:
         url: URL to fetch
-        cached_entry: Cached data for comparison (unused in current implementation)
+        cached_entry: Cached data whose validators make the request conditional
         timeout: Request timeout in seconds
+        line_handler: Optional function called with each unfolded line
         
     Returns:
-        Tuple of (content_bytes, last_modified, etag, status_code, content_length, content_hash)
+        Tuple of (content_bytes, last_modified, etag, status_code, content_length)
+        content_bytes is None when the server answers 304 Not Modified or
+        the body was streamed to line_handler
     """
     if timeout is None:
         timeout = HTTP_TIMEOUT
@@ -648,23 +1092,53 @@ def http_fetch_content(url, cached_entry=None, timeout=None):
         "Accept": "text/calendar, text/html, application/xml;q=0.9, */*;q=0.8",
         "Accept-Encoding": "identity"
     }
+    
+    # Let the server skip the body when our cached copy is still current
+    cached_last_modified = cached_etag = None
+    if cached_entry and len(cached_entry) >= 5:
+        cached_last_modified, cached_etag = cached_entry[1], cached_entry[2]
+        if cached_etag:
+            headers["If-None-Match"] = cached_etag
+        if cached_last_modified:
+            headers["If-Modified-Since"] = cached_last_modified
 
     response = urequests.get(url, headers=headers, timeout=timeout)
-    content_bytes = response.content
     last_modified = response.headers.get("Last-Modified")
     etag = response.headers.get("ETag")
     
-    # Calculate hash and size for caching
-    content_hash = calculate_content_hash(content_bytes)
-    content_length = len(content_bytes)
+    if response.status_code == 304 and (cached_etag or cached_last_modified):
+        response.close()
+        return (None, last_modified or cached_last_modified, etag or cached_etag, 304,
+                cached_entry[4])
+    
+    stream = getattr(response, "raw", None)
+    if line_handler is not None and stream is not None:
+        counter = [0]
+        try:
+            for line_bytes in unfold_lines(iter_stream_lines(stream, counter)):
+                line_handler(line_bytes)
+        finally:
+            response.close()
+        
+        return None, last_modified, etag, 200, counter[0]
+    
+    content_bytes = response.content
+    
+    if line_handler is not None:
+        for line_bytes in scan_vevents(content_bytes):
+            line_handler(line_bytes)
     
-    return content_bytes, last_modified, etag, 200, content_length, content_hash
+    return content_bytes, last_modified, etag, 200, len(content_bytes)
 
 # === CACHING UTILITIES ===
 def is_content_fresh(url, cached_entry):
     """
     Use HEAD request to check if cached content is still fresh.
     
+    The HEAD probe is only used for servers that sent neither ETag nor
+    Last-Modified; otherwise the conditional GET in http_fetch_content()
+    answers the same question in a single round trip.
+    
     Args:
         url: URL to check
         cached_entry: Tuple of cached data
@@ -679,10 +1153,18 @@ def is_content_fresh(url, cached_entry):
     if len(cached_entry) >= 4:
         events_list, cached_last_modified, cached_etag, parse_time = cached_entry[:4]
         cached_content_length = cached_entry[4] if len(cached_entry) > 4 else None
-        cached_hash = cached_entry[5] if len(cached_entry) > 5 else None
     else:
         return False  # Invalid cache format
     
+    # A recent parse is trusted without asking the server again
+    cache_age = utime.time() - parse_time
+    if cache_age < CACHE_VALIDITY_SECONDS:
+        return True
+    
+    # Validators present: let the conditional GET report 304 instead
+    if (cached_last_modified or cached_etag) and len(cached_entry) >= 5:
+        return False
+    
     # Perform HEAD request to get current metadata
     head_last_modified, head_etag, head_content_length = http_head_request(url)
     
@@ -711,7 +1193,6 @@ def is_content_fresh(url, cached_entry):
         return True
     
     # No reliable indicators - use time-based fallback
-    cache_age = utime.time() - parse_time
     if cache_age > 900:  # 15 minutes
         print("Cache expired: Time-based refresh")
         return False
@@ -720,6 +1201,182 @@ def is_content_fresh(url, cached_entry):
     return True
 
 # === ICS PARSING ===
+def scan_vevents(content_bytes):
+    """
+    Yield the unfolded lines of each VEVENT block in iCalendar content.
+    
+    Everything outside VEVENT blocks (VTIMEZONE definitions, calendar
+    headers) is skipped with bytes.find instead of being split into lines.
+    
+    Args:
+        content_bytes: Raw iCalendar content as bytes
+        
+    Yields:
+        Unfolded lines as bytes, from BEGIN:VEVENT through END:VEVENT
+    """
+    pos = 0
+    while True:
+        begin = content_bytes.find(b'BEGIN:VEVENT', pos)
+        if begin == -1:
+            return
+        if begin and content_bytes[begin - 1] not in _NEWLINE_BYTES:
+            pos = begin + 12
+            continue
+
+        end = content_bytes.find(b'\nEND:VEVENT', begin)
+        if end == -1:
+            end = len(content_bytes)
+        else:
+            end += 11
+        pos = end
+
+        yield from unfold_lines(content_bytes[begin:end].splitlines())
+
+def unfold_lines(raw_lines):
+    """
+    Join folded iCalendar lines back into logical lines.
+    
+    Args:
+        raw_lines: Iterable of physical lines as bytes, without line endings
+        
+    Yields:
+        Unfolded, non-empty lines as bytes
+    """
+    # Pieces of the current logical line, joined once it is complete so
+    # long folded values are not rebuilt on every continuation
+    parts = []
+    for raw_line_bytes in raw_lines:
+        if not raw_line_bytes:
+            continue
+
+        # Handle line unfolding (lines starting with space/tab are continuations)
+        if raw_line_bytes[0] in _FOLD_BYTES and parts:
+            parts.append(raw_line_bytes[1:])
+        else:
+            if parts:
+                yield parts[0] if len(parts) == 1 else b"".join(parts)
+            parts = [raw_line_bytes]
+
+    if parts:
+        yield parts[0] if len(parts) == 1 else b"".join(parts)
+
+# === PROPERTY HANDLERS ===
+# Each handler stores one VEVENT property into the raw event dict; colon_pos
+# is the offset of the first ':' in the line
+def _handle_dtstart(current, line_bytes, colon_pos):
+    ts, tzid = parse_datetime_bytes(line_bytes)
+    if ts is not None:
+        current['dtstart'] = ts
+        # Timezone from the DTSTART line applies to the whole event
+        if tzid is not None:
+            current['tzid'] = tzid
+
+def _handle_dtend(current, line_bytes, colon_pos):
+    ts, _ = parse_datetime_bytes(line_bytes)
+    if ts is not None:
+        current['dtend'] = ts
+
+def _handle_summary(current, line_bytes, colon_pos):
+    current['summary'] = line_bytes[colon_pos + 1:].decode('utf-8').strip()
+
+def _handle_description(current, line_bytes, colon_pos):
+    current['description'] = clean_description(line_bytes[colon_pos + 1:])
+
+def _handle_rrule(current, line_bytes, colon_pos):
+    rrule_val_str = line_bytes[colon_pos + 1:].decode('utf-8')
+    current['rrule'] = rrule_val_str
+
+    try:
+        parsed_rule = parse_rrule(rrule_val_str)
+
+        # Process BYDAY constraints (stored as sets for O(1) membership tests)
+        if "BYDAY" in parsed_rule:
+            try:
+                processed_byday = []
+                for bd_str in parsed_rule["BYDAY"].split(","):
+                    if len(bd_str) != 2:
+                        bd_str = bd_str.strip()
+                        if len(bd_str) != 2:
+                            continue
+                    day_num = _DAY_PAIRS.get(
+                        ((ord(bd_str[0]) << 8) | ord(bd_str[1])) & _DAY_CASE_MASK)
+                    if day_num is not None:
+                        processed_byday.append(day_num)
+                parsed_rule['_byday_processed'] = set(processed_byday)
+            except:
+                parsed_rule['_byday_processed'] = []
+        else:
+            parsed_rule['_byday_processed'] = []
+
+        # Process BYMONTH constraints
+        if "BYMONTH" in parsed_rule:
+            try:
+                processed_bymonth = []
+                for m_str in parsed_rule["BYMONTH"].split(","):
+                    try:
+                        processed_bymonth.append(int(m_str))
+                    except ValueError:
+                        pass
+                parsed_rule['_bymonth_processed'] = set(processed_bymonth)
+            except:
+                parsed_rule['_bymonth_processed'] = []
+        else:
+            parsed_rule['_bymonth_processed'] = []
+
+        # Process BYMONTHDAY constraints
+        if "BYMONTHDAY" in parsed_rule:
+            try:
+                processed_bymonthday = []
+                for md_str in parsed_rule["BYMONTHDAY"].split(","):
+                    try:
+                        processed_bymonthday.append(int(md_str))
+                    except ValueError:
+                        pass
+                parsed_rule['_bymonthday_processed'] = set(processed_bymonthday)
+            except:
+                parsed_rule['_bymonthday_processed'] = []
+        else:
+            parsed_rule['_bymonthday_processed'] = []
+
+        # Choose the BY* check once instead of on every candidate
+        parsed_rule['_match_fn'] = select_rule_matcher(
+            parsed_rule['_byday_processed'], parsed_rule['_bymonth_processed'],
+            parsed_rule['_bymonthday_processed'])
+
+        # Process UNTIL constraint
+        if "UNTIL" in parsed_rule:
+            parsed_rule['_until_ts'] = parse_datetime_value(
+                parsed_rule["UNTIL"].strip(), current.get('tzid', 'UTC'))
+        else:
+            parsed_rule['_until_ts'] = None
+
+    except:
+        parsed_rule = {}
+
+    current['_parsed_rrule'] = parsed_rule
+
+def _handle_exdate(current, line_bytes, colon_pos):
+    parse_date_list(line_bytes.decode('utf-8'), current, 'exdates')
+
+def _handle_rdate(current, line_bytes, colon_pos):
+    parse_date_list(line_bytes.decode('utf-8'), current, 'rdates')
+
+def _handle_recurrence_id(current, line_bytes, colon_pos):
+    rid, _ = parse_datetime_bytes(line_bytes)
+    if rid is not None:
+        current['recurrence_id'] = rid
+
+_PROPERTY_HANDLERS = {
+    b'DTSTART': _handle_dtstart,
+    b'DTEND': _handle_dtend,
+    b'SUMMARY': _handle_summary,
+    b'DESCRIPTION': _handle_description,
+    b'RRULE': _handle_rrule,
+    b'EXDATE': _handle_exdate,
+    b'RDATE': _handle_rdate,
+    b'RECURRENCE-ID': _handle_recurrence_id,
+}
+
 def process_ics_line(line_bytes):
     """
     Process a single logical line from an iCalendar file.
@@ -730,7 +1387,7 @@ def process_ics_line(line_bytes):
     Args:
         line_bytes: Single unfolded line from iCalendar as bytes
     """
-    global _in_event_state, _current_raw_event_state, _raw_events_data_list
+    global _in_event_state, _current_raw_event_state
 
     # Handle event boundaries
     if line_bytes == b'BEGIN:VEVENT':
@@ -747,7 +1404,19 @@ def process_ics_line(line_bytes):
             # Set default end time if missing (1 hour duration)
             if _current_raw_event_state['dtend'] == 0:
                 _current_raw_event_state['dtend'] = _current_raw_event_state['dtstart'] + 3600
-            _raw_events_data_list.append(_current_raw_event_state)
+            # Build the EXDATE lookup once instead of on every occurrence search
+            if _current_raw_event_state['exdates']:
+                _current_raw_event_state['_exdates_set'] = set(_current_raw_event_state['exdates'])
+            if 'recurrence_id' in _current_raw_event_state:
+                # Recurrence exception: overrides one occurrence of a series,
+                # indexed by timezone and then by the occurrence it replaces
+                rid_tzid = _current_raw_event_state.get('tzid', 'UTC')
+                tz_overrides = _overrides_map.get(rid_tzid)
+                if tz_overrides is None:
+                    tz_overrides = _overrides_map[rid_tzid] = {}
+                tz_overrides[_current_raw_event_state['recurrence_id']] = _current_raw_event_state
+            else:
+                _raw_events_data_list.append(_current_raw_event_state)
         _current_raw_event_state = None
         _in_event_state = False
         return
@@ -755,123 +1424,19 @@ def process_ics_line(line_bytes):
     if not _in_event_state or not _current_raw_event_state:
         return
 
-    # Parse event properties
-    if line_bytes.startswith(b'DTSTART'):
-        line_str = line_bytes.decode('utf-8')
-        ts = parse_datetime(line_str)
-        if ts is not None:
-            _current_raw_event_state['dtstart'] = ts
-            # Extract timezone from DTSTART line
-            tzid_pos = line_str.find("TZID=")
-            if tzid_pos != -1:
-                tz_start = tzid_pos + 5
-                tz_end = line_str.find(":", tz_start)
-                if tz_end != -1:
-                    _current_raw_event_state['tzid'] = normalize_timezone_id(line_str[tz_start:tz_end])
-
-    elif line_bytes.startswith(b'DTEND'):
-        line_str = line_bytes.decode('utf-8')
-        ts = parse_datetime(line_str)
-        if ts is not None:
-            _current_raw_event_state['dtend'] = ts
-
-    elif line_bytes.startswith(b'SUMMARY:'):
-        _current_raw_event_state['summary'] = line_bytes[8:].decode('utf-8').strip()
-
-    elif line_bytes.startswith(b'DESCRIPTION'):
-        colon_pos = line_bytes.find(b':')
-        if colon_pos != -1:
-            _current_raw_event_state['description'] = clean_description(
-                line_bytes[colon_pos+1:].decode('utf-8').strip()
-            )
-
-    elif line_bytes.startswith(b'RRULE:'):
-        rrule_val_str = line_bytes[6:].decode('utf-8')
-        _current_raw_event_state['rrule'] = rrule_val_str
-
-        try:
-            parsed_rule = parse_rrule(rrule_val_str)
-            
-            # Process BYDAY constraints
-            if "BYDAY" in parsed_rule:
-                try:
-                    processed_byday = []
-                    for bd_str in parsed_rule["BYDAY"].split(","):
-                        clean_bd = bd_str.strip().upper()
-                        if clean_bd in _DAY_MAP:
-                            processed_byday.append(_DAY_MAP[clean_bd])
-                    parsed_rule['_byday_processed'] = processed_byday
-                except:
-                    parsed_rule['_byday_processed'] = []
-            else:
-                parsed_rule['_byday_processed'] = []
-
-            # Process BYMONTH constraints
-            if "BYMONTH" in parsed_rule:
-                try:
-                    processed_bymonth = []
-                    for m_str in parsed_rule["BYMONTH"].split(","):
-                        try:
-                            processed_bymonth.append(int(m_str))
-                        except ValueError:
-                            pass
-                    parsed_rule['_bymonth_processed'] = processed_bymonth
-                except:
-                    parsed_rule['_bymonth_processed'] = []
-            else:
-                parsed_rule['_bymonth_processed'] = []
-
-            # Process BYMONTHDAY constraints
-            if "BYMONTHDAY" in parsed_rule:
-                try:
-                    processed_bymonthday = []
-                    for md_str in parsed_rule["BYMONTHDAY"].split(","):
-                        try:
-                            processed_bymonthday.append(int(md_str))
-                        except ValueError:
-                            pass
-                    parsed_rule['_bymonthday_processed'] = processed_bymonthday
-                except:
-                    parsed_rule['_bymonthday_processed'] = []
-            else:
-                parsed_rule['_bymonthday_processed'] = []
-
-            # Process UNTIL constraint
-            if "UNTIL" in parsed_rule:
-                u = parsed_rule["UNTIL"]
-                is_utc = u.endswith("Z")
-                u_clean = u[:-1] if is_utc else u
-                try:
-                    if len(u_clean) >= 8:
-                        y, mo, d = int(u_clean[0:4]), int(u_clean[4:6]), int(u_clean[6:8])
-                        h = int(u_clean[9:11]) if len(u_clean) >= 11 else 0
-                        mi = int(u_clean[11:13]) if len(u_clean) >= 13 else 0
-                        s = int(u_clean[13:15]) if len(u_clean) >= 15 else 0
-
-                        if is_utc:
-                            parsed_rule['_until_ts'] = utime.mktime((y, mo, d, h, mi, s, 0, 0))
-                        else:
-                            parsed_rule['_until_ts'] = convert_to_utc((y, mo, d, h, mi, s), _current_raw_event_state.get('tzid', 'UTC'))
-                except:
-                    parsed_rule['_until_ts'] = None
-            else:
-                parsed_rule['_until_ts'] = None
-
-        except:
-            parsed_rule = {}
-        
-        _current_raw_event_state['_parsed_rrule'] = parsed_rule
-
-    elif line_bytes.startswith(b'EXDATE'):
-        parse_date_list(line_bytes.decode('utf-8'), _current_raw_event_state, 'exdates')
-
-    elif line_bytes.startswith(b'RDATE'):
-        parse_date_list(line_bytes.decode('utf-8'), _current_raw_event_state, 'rdates')
+    # Most event properties (UID, DTSTAMP, ATTENDEE, ...) are not used
+    if line_bytes[0] not in _PROPERTY_LEAD_BYTES:
+        return
 
-    elif line_bytes.startswith(b'RECURRENCE-ID'):
-        rid = parse_datetime(line_bytes.decode('utf-8'))
-        if rid is not None:
-            _current_raw_event_state['recurrence_id'] = rid
+    # Dispatch on the property name, which ends at the first ';' (parameters)
+    # or ':' (value)
+    colon_pos = line_bytes.find(b':')
+    if colon_pos == -1:
+        return
+    name_end = line_bytes.find(b';', 0, colon_pos)
+    handler = _PROPERTY_HANDLERS.get(line_bytes[:colon_pos if name_end == -1 else name_end])
+    if handler is not None:
+        handler(_current_raw_event_state, line_bytes, colon_pos)
 
 def parse_calendar_from_url(url, end_filter_days=31):
     """
@@ -887,12 +1452,13 @@ def parse_calendar_from_url(url, end_filter_days=31):
     Yields:
         Event objects sorted by start time
     """
-    global _in_event_state, _current_raw_event_state, _raw_events_data_list, _parsing_cache
+    global _in_event_state, _current_raw_event_state, _raw_events_data_list, _overrides_map, _parsing_cache
 
     # Initialize parsing state
     _in_event_state = False
     _current_raw_event_state = None
     _raw_events_data_list = []
+    _overrides_map = {}
 
     # Calculate time filters
     start_filter_ts = utime.time()
@@ -910,101 +1476,97 @@ def parse_calendar_from_url(url, end_filter_days=31):
         if cached_entry:
             print("Using cached events (HEAD check confirms freshness)")
             events_list = cached_entry[0]
-            for event in events_list:
-                if event.dtend >= start_filter_ts and event.dtstart <= end_filter_ts:
-                    yield event
+            for event in events_in_window(events_list, start_filter_ts, end_filter_ts):
+                yield event
             return
 
-    # Content changed or no cache - fetch with GET
-    fetch_result = http_fetch_content(processed_url)
+    # Content changed or no cache - fetch with conditional GET, parsing the
+    # body as it streams in
+    fetch_result = http_fetch_content(processed_url, cached_entry, line_handler=process_ics_line)
     
-    if len(fetch_result) == 6:
-        all_ics_content_bytes, new_last_modified, new_etag, status_code, content_length, content_hash = fetch_result
-    else:
-        # Fallback for different return format
-        all_ics_content_bytes, new_last_modified, new_etag, status_code = fetch_result[:4]
-        content_length = len(all_ics_content_bytes) if all_ics_content_bytes else 0
-        content_hash = calculate_content_hash(all_ics_content_bytes) if all_ics_content_bytes else ""
+    # The length was counted while the body streamed in
+    _, new_last_modified, new_etag, status_code, content_length = fetch_result
+
+    if status_code == 304 and cached_entry:
+        # Server confirmed our copy is current; skip parsing entirely
+        print("Using cached events (server reports not modified)")
+        events_list = cached_entry[0]
+        _parsing_cache[processed_url] = (
+            events_list, new_last_modified, new_etag, utime.time(), content_length
+        )
+        for event in events_in_window(events_list, start_filter_ts, end_filter_ts):
+            yield event
+        return
 
-    if status_code == 304 or all_ics_content_bytes is None:
+    if status_code == 304:
         return
 
-    # Process iCalendar content (unfold lines and parse)
-    unfolded_line_bytes = b""
-    for raw_line_bytes in all_ics_content_bytes.splitlines():
-        if not raw_line_bytes:
+    # process_ics_line already split the events into series and overrides;
+    # take them over so the module state can be released
+    regular_events_raw = _raw_events_data_list
+    overrides_map = _overrides_map
+    _raw_events_data_list = []
+    _overrides_map = {}
+
+    # Expand every series first, so the event list can be allocated once
+    # at its final size
+    batches = []
+    total_occurrences = 0
+    for raw_event in regular_events_raw:
+        try:
+            batch = process_event_occurrences_soa(raw_event, start_filter_ts, end_filter_ts)
+        except MemoryError:
+            # Only collect when the heap is actually exhausted, then retry once
+            gc.collect()
+            batch = process_event_occurrences_soa(raw_event, start_filter_ts, end_filter_ts)
+        if batch is None or len(batch[0]) == 0:
             continue
-            
-        # Handle line unfolding (lines starting with space/tab are continuations)
-        if raw_line_bytes[0:1] in (b' ', b'\t') and unfolded_line_bytes:
-            unfolded_line_bytes += raw_line_bytes[1:]
-        else:
-            # Process previous complete line
-            if unfolded_line_bytes:
-                process_ics_line(unfolded_line_bytes)
-            unfolded_line_bytes = raw_line_bytes
-    
-    # Process final line
-    if unfolded_line_bytes:
-        process_ics_line(unfolded_line_bytes)
-
-    # Post-processing: separate recurrence exceptions from regular events
-    overrides_map = {}
-    regular_events_raw = []
-    
-    for raw_event in _raw_events_data_list:
-        if 'recurrence_id' in raw_event:
-            # This is a recurrence exception (overrides a specific occurrence)
-            rid_dtstart = raw_event['recurrence_id']
-            rid_tzid = raw_event.get('tzid', 'UTC')
-            overrides_map[(rid_dtstart, rid_tzid)] = raw_event
-        else:
-            regular_events_raw.append(raw_event)
-    
-    # Clear raw events data to free memory
-    _raw_events_data_list.clear()
-    gc.collect()
+        batches.append(batch)
+        total_occurrences += len(batch[0])
 
     # Generate event occurrences
-    generated_events = []
-    for raw_event in regular_events_raw:
-        for occurrence in process_event_occurrences(raw_event, start_filter_ts, end_filter_ts, now_ts):
+    generated_events = [None] * total_occurrences
+    idx = 0
+    for dtstarts, dtends, summary, description, tzid in batches:
+        # A series has one timezone, so its overrides are found by start time alone
+        tz_overrides = overrides_map.get(tzid)
+
+        for i in range(len(dtstarts)):
             # Check if this occurrence has an override
-            override_key = (occurrence.dtstart, occurrence.tzid)
-            if override_key in overrides_map:
+            if tz_overrides is not None and dtstarts[i] in tz_overrides:
                 # Use the override event instead of the generated occurrence
-                override_raw_data = overrides_map[override_key]
-                override_event = Event(
+                override_raw_data = tz_overrides[dtstarts[i]]
+                generated_events[idx] = Event(
                     override_raw_data['dtstart'], 
                     override_raw_data['dtend'],
                     override_raw_data.get('summary', ''), 
                     override_raw_data.get('description', ''),
                     override_raw_data.get('tzid', 'UTC')
                 )
-                generated_events.append(override_event)
             else:
-                generated_events.append(occurrence)
-        
-        # Periodic garbage collection during processing
-        if len(generated_events) % 10 == 0:
-            gc.collect()
+                # Only occurrences that survive the override check become Events
+                generated_events[idx] = Event._new(dtstarts[i], dtends[i], summary, description, tzid)
+            idx += 1
+    batches = None
     
-    # Sort and yield events
-    if generated_events:
-        generated_events.sort()
-        for event in generated_events:
-            yield event
+    generated_events.sort(key=_dtstart_key)
 
-    # Update cache with new data (consistent 6-element format)
+    # Update cache with new data (consistent 5-element format) before
+    # yielding, so consumers that stop early still leave it populated
+    if processed_url not in _parsing_cache and len(_parsing_cache) >= MAX_CACHED_CALENDARS:
+        _parsing_cache.clear()
     _parsing_cache[processed_url] = (
         generated_events, 
         new_last_modified, 
         new_etag, 
         utime.time(),
-        content_length,
-        content_hash
+        content_length
     )
 
+    # Yield events in start order
+    for event in generated_events:
+        yield event
+
 # === PUBLIC API ===
 def get_events(url, max_events=None, start_filter_ts=None, end_filter_days=31):
     """
@@ -1044,35 +1606,33 @@ def get_events(url, max_events=None, start_filter_ts=None, end_filter_days=31):
         # Use cached data if still valid
         events_list = cached_entry[0]
         end_filter_ts = start_filter_ts + (end_filter_days * _SECONDS_PER_DAY)
-        filtered_events = [e for e in events_list 
-                         if e.dtend >= start_filter_ts and e.dtstart <= end_filter_ts]
-        filtered_events.sort()
-        return filtered_events[:max_events]
+        return events_in_window(events_list, start_filter_ts, end_filter_ts)[:max_events]
 
     try:
         # Parse fresh data from URL
         temp_events_list = []
-        seen_events = set()
+        # Events arrive sorted by start time, so duplicates can only be
+        # among the events sharing the current start time
+        same_start = []
 
         for event in parse_calendar_from_url(processed_url, end_filter_days):
-            event_hash = hash(event)
-            if event_hash not in seen_events:
-                temp_events_list.append(event)
-                seen_events.add(event_hash)
-                if max_events > 0 and len(temp_events_list) >= max_events:
-                    break
+            if same_start and event.dtstart != same_start[0].dtstart:
+                same_start = []
+            elif event in same_start:
+                continue
+            same_start.append(event)
+            temp_events_list.append(event)
+            if max_events > 0 and len(temp_events_list) >= max_events:
+                break
 
         if temp_events_list:
-            temp_events_list.sort()
+            temp_events_list.sort(key=_dtstart_key)
             return temp_events_list[:max_events]
         elif cached_entry and len(cached_entry) >= 1:
             # Fallback to cached events if available
             events_list = cached_entry[0]
             end_filter_ts = start_filter_ts + (end_filter_days * _SECONDS_PER_DAY)
-            filtered_events = [e for e in events_list 
-                             if e.dtend >= start_filter_ts and e.dtstart <= end_filter_ts]
-            filtered_events.sort()
-            return filtered_events[:max_events]
+            return events_in_window(events_list, start_filter_ts, end_filter_ts)[:max_events]
         
         return []
         
@@ -1082,10 +1642,7 @@ def get_events(url, max_events=None, start_filter_ts=None, end_filter_days=31):
         if cached_entry and len(cached_entry) >= 1:
             events_list = cached_entry[0]
             end_filter_ts = start_filter_ts + (end_filter_days * _SECONDS_PER_DAY)
-            filtered_events = [e for e in events_list 
-                             if e.dtend >= start_filter_ts and e.dtstart <= end_filter_ts]
-            filtered_events.sort()
-            return filtered_events[:max_events]
+            return events_in_window(events_list, start_filter_ts, end_filter_ts)[:max_events]
         return []
 
 def clear_cache():
@@ -1096,10 +1653,11 @@ def clear_cache():
     """
     global _parsing_cache
     _parsing_cache.clear()
+    _dt_cache.clear()
 
 def set_limits(max_recurrence_iterations=None, max_occurrences_per_event=None, 
                cache_validity_seconds=None, max_description_length=None,
-               max_rdate_count=None, http_timeout=None):
+               max_rdate_count=None, http_timeout=None, max_cached_calendars=None):
     """
     Adjust performance and memory limits.
     
@@ -1113,9 +1671,10 @@ def set_limits(max_recurrence_iterations=None, max_occurrences_per_event=None,
         max_description_length: Maximum length of event descriptions
         max_rdate_count: Maximum number of RDATE entries to process per event
         http_timeout: HTTP request timeout in seconds
+        max_cached_calendars: Maximum number of calendar URLs kept in the parse cache
     """
     global MAX_RECURRENCE_ITERATIONS, MAX_OCCURRENCES_PER_EVENT, CACHE_VALIDITY_SECONDS
-    global MAX_DESCRIPTION_LENGTH, MAX_RDATE_COUNT, HTTP_TIMEOUT
+    global MAX_DESCRIPTION_LENGTH, MAX_RDATE_COUNT, HTTP_TIMEOUT, MAX_CACHED_CALENDARS
     
     if max_recurrence_iterations is not None:
         MAX_RECURRENCE_ITERATIONS = max_recurrence_iterations
@@ -1129,6 +1688,8 @@ def set_limits(max_recurrence_iterations=None, max_occurrences_per_event=None,
         MAX_RDATE_COUNT = max_rdate_count
     if http_timeout is not None:
         HTTP_TIMEOUT = http_timeout
+    if max_cached_calendars is not None:
+        MAX_CACHED_CALENDARS = max_cached_calendars
 
 def get_memory_stats():
     """
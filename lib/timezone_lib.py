@@ -43,14 +43,23 @@ __author__ = "Dan Parker"
 __license__ = "GPLv3"
 
 # === MODULE CONSTANTS ===
-_TIMEZONE_STRUCT_FORMAT = "<iiBBBBBB"
+# Blob layout: header, fixed-width record table, length-prefixed names pool
+_BLOB_MAGIC = b"TZBLOB\0\0"
+_BLOB_FORMAT_VERSION = 1
+_HEADER_FORMAT = "<8sII"
+_HEADER_SIZE = 16
+_TIMEZONE_STRUCT_FORMAT = "<IiiI"
+_TIMEZONE_RECORD_SIZE = 16
 _DEFAULT_LOAD_TIMEOUT = 10
 _MAX_TIMEZONE_NAME_LENGTH = 100
 _TIMEOUT_CHECK_INTERVAL = 50
+_TZ_CACHE_SIZE = 64
 
 # === MODULE STATE ===
 _tzid_table = None
 _tz_cache = {}
+_dst_cache = {}  # timezone_id -> (year_start, year_end, dst_start, dst_end)
+_tzid_folded = None  # Lowercase name/suffix -> timezone ID, built on first use
 _timezone_loading = False
 
 def load_timezone_data(blob_path="tzid_blob.bin", timeout=_DEFAULT_LOAD_TIMEOUT):
@@ -83,55 +92,67 @@ def load_timezone_data(blob_path="tzid_blob.bin", timeout=_DEFAULT_LOAD_TIMEOUT)
         start_time = utime.time()
         
         with open(blob_path, "rb") as f:
-            entry_count = 0
+            header = f.read(_HEADER_SIZE)
+            if len(header) < _HEADER_SIZE:
+                raise ValueError("timezone blob header truncated")
+            magic, version, record_count = struct.unpack(_HEADER_FORMAT, header)
+            if magic != _BLOB_MAGIC or version != _BLOB_FORMAT_VERSION:
+                raise ValueError("unsupported timezone blob format")
+            names_offset = _HEADER_SIZE + record_count * _TIMEZONE_RECORD_SIZE
             
-            while True:
-                # Check timeout periodically to avoid blocking
-                if entry_count % _TIMEOUT_CHECK_INTERVAL == 0:
-                    if (utime.time() - start_time) > timeout:
-                        print("Timezone loading timeout, using partial data")
-                        break
-                
-                # Read timezone name length
-                name_len_bytes = f.read(1)
-                if not name_len_bytes:
+            # Read each section with a single call
+            records = f.read(names_offset - _HEADER_SIZE)
+            names = f.read()
+        
+        record_count = min(record_count, len(records) // _TIMEZONE_RECORD_SIZE)
+        names_len = len(names)
+        
+        # Unpack the whole record table in one call so the format is parsed
+        # once (MicroPython's struct module has no precompiled Struct)
+        fields = struct.unpack_from(
+            "<" + _TIMEZONE_STRUCT_FORMAT[1:] * record_count, records)
+        
+        for entry_index in range(record_count):
+            # Check timeout periodically to avoid blocking
+            if entry_index % _TIMEOUT_CHECK_INTERVAL == 0:
+                if (utime.time() - start_time) > timeout:
+                    print("Timezone loading timeout, using partial data")
                     break
-                    
-                name_len = name_len_bytes[0]
+            
+            try:
+                # Timezone data: name offset, std_offset, dst_offset, packed DST rule
+                base = entry_index * 4
+                name_offset = fields[base]
+                std_offset = fields[base + 1]
+                dst_offset = fields[base + 2]
+                dst_rule = fields[base + 3]
+                
+                if name_offset >= names_len:
+                    continue
+                name_len = names[name_offset]
                 if name_len == 0 or name_len > _MAX_TIMEZONE_NAME_LENGTH:
-                    break
+                    continue
                 
-                # Read timezone name and data in single operation
-                data_chunk = f.read(name_len + 14)
-                if len(data_chunk) < name_len + 14:
-                    break
-
-                name_bytes = data_chunk[:name_len]
-                timezone_data = data_chunk[name_len:]
+                timezone_id = names[name_offset + 1:name_offset + 1 + name_len].decode("utf-8")
                 
-                try:
-                    # Unpack timezone data: std_offset, dst_offset, start/end info
-                    std_offset, dst_offset, start_month, start_day, start_hour, \
-                    end_month, end_day, end_hour = struct.unpack(_TIMEZONE_STRUCT_FORMAT, timezone_data)
-                    
-                    timezone_id = name_bytes.decode("utf-8")
-                    
-                    # Store DST transition info (None if no DST)
-                    dst_start = (start_month, start_day, start_hour) if start_month else None
-                    dst_end = (end_month, end_day, end_hour) if end_month else None
-                    
-                    _tzid_table[timezone_id] = (std_offset, dst_offset, dst_start, dst_end)
-                    entry_count += 1
-                    
-                except (struct.error, UnicodeDecodeError):
-                    # Skip malformed entries
-                    continue
+                # Store DST transition info (None if no DST)
+                # dst_rule bits: start month(4) day(5) hour(5), end month(4) day(5) hour(5)
+                start_month = dst_rule >> 24
+                end_month = (dst_rule >> 10) & 0xF
+                dst_start = (start_month, (dst_rule >> 19) & 0x1F, (dst_rule >> 14) & 0x1F) if start_month else None
+                dst_end = (end_month, (dst_rule >> 5) & 0x1F, dst_rule & 0x1F) if end_month else None
+                
+                _tzid_table[timezone_id] = (std_offset, dst_offset, dst_start, dst_end)
+                
+            except UnicodeError:
+                # Skip malformed entries
+                continue
                     
         # Clean up memory after loading large datasets
         if len(_tzid_table) > 100:
             gc.collect()
                     
-    except OSError as e:
+    except (OSError, ValueError) as e:
         print(f"Timezone file error: {e}")
     except MemoryError as e:
         print(f"Memory error loading timezones: {e}")
@@ -145,6 +166,21 @@ def load_timezone_data(blob_path="tzid_blob.bin", timeout=_DEFAULT_LOAD_TIMEOUT)
     print(f"Loaded {len(_tzid_table)} timezones")
     return _tzid_table
 
+def _calculate_dst_year(timestamp, std_offset, dst_start, dst_end):
+    """
+    Calculate the DST transitions for the standard-time year containing timestamp.
+    
+    Returns:
+        tuple: (year_start, year_end, dst_start, dst_end) as UTC timestamps
+    """
+    year = utime.localtime(timestamp + std_offset)[0]
+    return (
+        utime.mktime((year, 1, 1, 0, 0, 0, 0, 0)) - std_offset,
+        utime.mktime((year + 1, 1, 1, 0, 0, 0, 0, 0)) - std_offset,
+        utime.mktime((year, dst_start[0], dst_start[1], dst_start[2], 0, 0, 0, 0)) - std_offset,
+        utime.mktime((year, dst_end[0], dst_end[1], dst_end[2], 0, 0, 0, 0)) - std_offset,
+    )
+
 def get_utc_offset(timezone_id, timestamp):
     """
     Calculate UTC offset for given timezone at specific timestamp.
@@ -175,17 +211,13 @@ def get_utc_offset(timezone_id, timestamp):
         if not dst_start or not dst_end:
             return std_offset
 
-        # Get year from timestamp for DST calculations
-        local_time = utime.localtime(timestamp + std_offset)
-        year = local_time[0]
-
-        def calculate_transition_timestamp(month, day, hour):
-            """Calculate UTC timestamp for DST transition."""
-            transition_tuple = (year, month, day, hour, 0, 0, 0, 0)
-            return utime.mktime(transition_tuple) - std_offset
-
-        dst_start_timestamp = calculate_transition_timestamp(*dst_start)
-        dst_end_timestamp = calculate_transition_timestamp(*dst_end)
+        # Reuse this zone's transitions while the timestamp stays in the same year
+        cached = _dst_cache.get(timezone_id)
+        if cached is None or not cached[0] <= timestamp < cached[1]:
+            cached = _calculate_dst_year(timestamp, std_offset, dst_start, dst_end)
+            _dst_cache[timezone_id] = cached
+        dst_start_timestamp = cached[2]
+        dst_end_timestamp = cached[3]
 
         # Determine if timestamp falls within DST period
         if dst_start_timestamp < dst_end_timestamp:
@@ -250,6 +282,44 @@ def convert_to_local(utc_timestamp, timezone_id):
     except Exception:
         return utime.localtime(utc_timestamp)
 
+def _get_folded_ids(timezone_table):
+    """
+    Build (once) the lowercase lookup used for case-insensitive matching.
+    
+    Maps each lowercased timezone ID, and each trailing part of it after
+    a "/", to the canonical ID. Full IDs win over suffixes; otherwise the
+    first ID in table order wins.
+    
+    Returns:
+        dict: Lowercased name or suffix -> canonical timezone ID
+    """
+    global _tzid_folded
+    if _tzid_folded is not None:
+        return _tzid_folded
+    
+    folded = {}
+    for timezone_key in timezone_table:
+        key_lower = timezone_key.lower()
+        folded[key_lower] = timezone_key
+    
+    for timezone_key in timezone_table:
+        key_lower = timezone_key.lower()
+        slash_pos = key_lower.find("/")
+        while slash_pos != -1:
+            suffix = key_lower[slash_pos + 1:]
+            if suffix not in folded:
+                folded[suffix] = timezone_key
+            slash_pos = key_lower.find("/", slash_pos + 1)
+    
+    _tzid_folded = folded
+    return folded
+
+def _remember_timezone_id(raw_timezone_id, result):
+    """Store a normalization result, clearing the cache when it is full."""
+    if len(_tz_cache) >= _TZ_CACHE_SIZE:
+        _tz_cache.clear()
+    _tz_cache[raw_timezone_id] = result
+
 def normalize_timezone_id(raw_timezone_id):
     """
     Normalize and validate timezone identifier.
@@ -280,28 +350,23 @@ def normalize_timezone_id(raw_timezone_id):
             
         timezone_table = load_timezone_data()
         if not timezone_table:
-            _tz_cache[raw_timezone_id] = cleaned_id
+            _remember_timezone_id(raw_timezone_id, cleaned_id)
             return cleaned_id
         
         # Try exact match first
         if cleaned_id in timezone_table:
             result = cleaned_id
         else:
-            # Try case-insensitive matching
-            cleaned_lower = cleaned_id.lower()
-            result = cleaned_id  # Default fallback
-            
-            for timezone_key in timezone_table:
-                key_lower = timezone_key.lower()
-                if key_lower == cleaned_lower or key_lower.endswith("/" + cleaned_lower):
-                    result = timezone_key
-                    break
+            # Try case-insensitive matching on the full ID, then on its
+            # trailing path components (e.g. "new_york")
+            folded_ids = _get_folded_ids(timezone_table)
+            result = folded_ids.get(cleaned_id.lower(), cleaned_id)
 
-        _tz_cache[raw_timezone_id] = result
+        _remember_timezone_id(raw_timezone_id, result)
         return result
         
     except Exception:
-        _tz_cache[raw_timezone_id] = "UTC"
+        _remember_timezone_id(raw_timezone_id, "UTC")
         return "UTC"
 
 def clear_timezone_cache():
@@ -316,10 +381,12 @@ def clear_timezone_data():
     """
     Clear loaded timezone data and trigger garbage collection.
     """
-    global _tzid_table
+    global _tzid_table, _tzid_folded
     if _tzid_table:
         _tzid_table.clear()
     _tzid_table = None
+    _tzid_folded = None
+    _dst_cache.clear()
     gc.collect()
 
 def get_library_info():